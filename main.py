@@ -5,30 +5,91 @@ Monitors GitHub repos for new internships and finds UW alumni at those companies
 """
 
 import argparse
-import sqlite3
+import atexit
 import os
 import sys
-from datetime import datetime
 import logging
+import signal
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 # Add src folder to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.config import Config
-from src.github_monitor import InternshipGitHubMonitor
-from src.linkedin_scraper import UWLinkedInScraper
-from src.excel_integration import ExcelIntegration
-from src.aws_monitor import EC2Monitor
-from src.redis_queue import CompanyQueue
+from config import Config
+from database import connect
+from github_monitor import InternshipGitHubMonitor
+# Selenium, pandas/openpyxl, boto3 and redis are imported by the components
+# that need them, so DB-only commands like summary/recent start quickly
 
 class UWInternshipFinder:
+    # Reporting SQL is kept as fixed strings so the connection's statement
+    # cache hands back the already-compiled statement on every call
+    _SQL_EXPORT = '''
+        SELECT 
+            i.company, i.role, i.location, i.application_link, i.discovered_date as internship_date,
+            COALESCE(p.name, 'No UW alumnus found') as alumnus_name,
+            COALESCE(p.title, '') as alumnus_title,
+            COALESCE(p.linkedin_url, '') as alumnus_linkedin
+        FROM internships i
+        LEFT JOIN profiles p ON p.company = i.company COLLATE NOCASE
+        ORDER BY i.discovered_date DESC
+    '''
+    _SQL_HAS_INTERNSHIPS = "SELECT EXISTS(SELECT 1 FROM internships)"
+    # Totals (trigger-maintained, see setup_database), last-7-days counts and the
+    # top 5 companies in one statement: one row per top company, each carrying
+    # the counts (a single row with a NULL count when there are no internships)
+    _SQL_SUMMARY = """
+        WITH counts AS (
+            SELECT
+                (SELECT value FROM meta WHERE key = 'internship_count') AS internship_count,
+                (SELECT value FROM meta WHERE key = 'profile_count') AS alumni_count,
+                (SELECT COUNT(*) FROM internships WHERE discovered_date >= date('now', '-7 days')) AS weekly_internships,
+                (SELECT COUNT(*) FROM profiles WHERE discovered_date >= date('now', '-7 days')) AS weekly_alumni
+        ),
+        top_companies AS (
+            SELECT company, n AS count
+            FROM company_stats
+            ORDER BY n DESC
+            LIMIT 5
+        )
+        SELECT counts.*, top_companies.company, top_companies.count
+        FROM counts LEFT JOIN top_companies
+        ORDER BY top_companies.count DESC
+    """
+    # Placeholders for the company list are appended per call
+    _SQL_RECENTLY_SCRAPED = """
+        SELECT company FROM company_searches
+        WHERE searched_at > date('now', ?)
+        AND company IN ({placeholders})
+    """
+    
+    # Listing entries, filled by column name from sqlite3.Row results
+    _ALUMNUS_ENTRY = (
+        "{name}\n"
+        "    Title: {title}\n"
+        "    Company: {company}\n"
+        "    LinkedIn: {linkedin_url}\n"
+        "    Found: {discovered_date}\n"
+    )
+    _INTERNSHIP_ENTRY = "{company} - {role}\n    Location: {location}\n"
+    _INTERNSHIP_APPLY = "    Apply: {application_link}\n"
+    _INTERNSHIP_FOUND = "    Found: {discovered_date}\n"
+    
     def __init__(self):
         self.config = Config()
+        # Created eagerly: it also creates the database schema the reports read
         self.github_monitor = InternshipGitHubMonitor()
-        self.linkedin_scraper = UWLinkedInScraper()
-        self.excel_integration = ExcelIntegration()
-        self.ec2_monitor = EC2Monitor()
+        
+        # One connection for all reporting queries, closed on interpreter exit.
+        # sqlite3 keeps each distinct query prepared on it (cached_statements),
+        # so repeated reports skip the compile step
+        self.conn = connect(self.config.DATABASE_PATH)
+        self.conn.row_factory = sqlite3.Row
+        atexit.register(self.close)
         
         # Setup logging
         logging.basicConfig(
@@ -41,35 +102,51 @@ class UWInternshipFinder:
         )
         self.logger = logging.getLogger(__name__)
     
+    def close(self):
+        """Close the reporting connection and the GitHub monitor's"""
+        # Let SQLite refresh statistics for the tables this run queried
+        self.conn.execute('PRAGMA optimize')
+        self.conn.close()
+        self.github_monitor.close()
+    
+    @cached_property
+    def linkedin_scraper(self):
+        """LinkedIn scraper, created on first use"""
+        from linkedin_scraper import UWLinkedInScraper
+        return UWLinkedInScraper()
+    
+    @cached_property
+    def excel_integration(self):
+        """Excel workbook writer, created on first use"""
+        from excel_integration import ExcelIntegration
+        return ExcelIntegration()
+    
+    @cached_property
+    def ec2_monitor(self):
+        """EC2 status checker, created on first use"""
+        from aws_monitor import EC2Monitor
+        return EC2Monitor()
+    
     def run_full_cycle(self):
-        """Run a complete monitoring cycle"""
-        print(f"\nStarting internship monitoring cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 60)
-        
-        # Step 1: Monitor GitHub for new internships
-        print("\nStep 1: Monitoring GitHub repositories for new internships...")
-        new_companies = self.github_monitor.run_monitor()
-        
-        # Step 2: If new companies found, search for UW alumni
-        data_updated = False
-        if new_companies:
-            print(f"\nStep 2: Searching for UW alumni at {len(set(new_companies))} companies...")
-            unique_companies = list(set(new_companies))  # Remove duplicates
-            
-            # Limit to prevent overwhelming LinkedIn
-            if len(unique_companies) > 10:
-                print(f"Warning: Limiting search to first 10 companies to be respectful to LinkedIn")
-                unique_companies = unique_companies[:10]
-            
-            self.linkedin_scraper.scrape_companies(unique_companies)
-            data_updated = True
+        """Run a complete monitoring cycle.
+        Progress goes through the logger (timestamped, and formatted only when
+        a handler wants it) since this usually runs unattended under `monitor`.
+        Returns True if the Excel workbook was rebuilt during the cycle.
+        """
+        self.logger.info("Starting internship monitoring cycle")
+        
+        if self.config.LINKEDIN_USE_QUEUE:
+            new_companies = self._monitor_and_enqueue()
+            data_updated = False
         else:
-            print("\nNo new internships found, so no LinkedIn scraping needed.")
+            new_companies, data_updated = self._monitor_and_scrape()
         
         # Step 3: Update Excel if any new data was found
+        excel_updated = False
         if new_companies or data_updated:
-            print(f"\nStep 3: Updating Excel spreadsheet...")
+            self.logger.info("Step 3: Updating Excel spreadsheet...")
             success = self.excel_integration.create_or_update_excel()
+            excel_updated = bool(success)
             if success:
                 # Add notification about new findings
                 if new_companies:
@@ -77,163 +154,218 @@ class UWInternshipFinder:
                         f"Found {len(new_companies)} new internship opportunities!"
                     )
         
-        print(f"\nMonitoring cycle completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 60)
+        self.logger.info("Monitoring cycle completed")
+        return excel_updated
+    
+    def _monitor_and_scrape(self):
+        """Steps 1 and 2 in this process: scan GitHub, then search LinkedIn for
+        alumni at the new companies. Returns (new_companies, data_updated)."""
+        # Step 1: Monitor GitHub for new internships. As soon as the first repo
+        # turns up new companies, start the browser and log in to LinkedIn in the
+        # background so step 2 doesn't wait on that after GitHub is done
+        # (parallel scraping opens its own sessions, so only the single-browser path)
+        login_executor = ThreadPoolExecutor(max_workers=1)
+        login_future = None
+        
+        def start_linkedin_session(companies):
+            nonlocal login_future
+            if login_future is None and self.config.LINKEDIN_WORKERS <= 1:
+                login_future = login_executor.submit(self.linkedin_scraper.start_session)
+        
+        self.logger.info("Step 1: Monitoring GitHub repositories for new internships...")
+        new_companies = self.github_monitor.run_monitor(on_new_companies=start_linkedin_session)
+        login_executor.shutdown(wait=True)
+        logged_in = login_future.result() if login_future else None
+        
+        # Step 2: If new companies found, search for UW alumni
+        data_updated = False
+        if new_companies and logged_in is False:
+            self.logger.warning("Step 2: Skipping LinkedIn search - login failed")
+        elif new_companies:
+            unique_companies = list(dict.fromkeys(new_companies))  # Remove duplicates, keep discovery order
+            unique_companies = self._companies_needing_alumni_search(unique_companies)
+            
+            if unique_companies:
+                self.logger.info("Step 2: Searching for UW alumni at %d companies...", len(unique_companies))
+                
+                # Limit to prevent overwhelming LinkedIn
+                if len(unique_companies) > 10:
+                    self.logger.warning("Limiting search to first 10 companies to be respectful to LinkedIn")
+                    unique_companies = unique_companies[:10]
+                
+                self.linkedin_scraper.scrape_companies(unique_companies)
+                data_updated = True
+            else:
+                if logged_in:
+                    self.linkedin_scraper.cleanup()
+                self.logger.info("Step 2: All companies were searched recently, skipping LinkedIn")
+        else:
+            if logged_in:
+                self.linkedin_scraper.cleanup()
+            self.logger.info("No new internships found, so no LinkedIn scraping needed.")
+        
+        return new_companies, data_updated
+    
+    def _monitor_and_enqueue(self):
+        """Steps 1 and 2 through the Redis queue: each repo's companies are queued
+        as soon as that repo is parsed, so `worker` processes search LinkedIn
+        (and save the alumni) while GitHub is still being scanned"""
+        from redis_queue import CompanyQueue
+        queue = CompanyQueue()
+        enqueued = 0
+        
+        def enqueue_companies(companies):
+            nonlocal enqueued
+            for company in self._companies_needing_alumni_search(list(dict.fromkeys(companies))):
+                if queue.enqueue_company(company):
+                    enqueued += 1
+        
+        self.logger.info("Step 1: Monitoring GitHub repositories for new internships...")
+        new_companies = self.github_monitor.run_monitor(on_new_companies=enqueue_companies)
+        self.logger.info("Step 2: Queued %d companies for LinkedIn workers", enqueued)
+        return new_companies
+    
+    def _companies_needing_alumni_search(self, companies):
+        """Drop companies whose alumni were already searched in the last
+        ALUMNI_RESCAN_DAYS days, using one IN (...) probe for the whole list"""
+        if not companies:
+            return companies
+        
+        query = self._SQL_RECENTLY_SCRAPED.format(placeholders=','.join('?' * len(companies)))
+        cursor = self.conn.execute(query, (f"-{self.config.ALUMNI_RESCAN_DAYS} days", *companies))
+        recent = {row['company'].lower() for row in cursor}
+        
+        if recent:
+            self.logger.info("Skipping %d companies searched in the last %d days",
+                             len(recent), self.config.ALUMNI_RESCAN_DAYS)
+        return [company for company in companies if company.lower() not in recent]
     
     def export_opportunities_to_csv(self):
         """Export found opportunities to CSV for easy viewing"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
-        
-        # Query to join internships with profiles
-        query = '''
-        SELECT 
-            i.company, i.role, i.location, i.application_link, i.discovered_date as internship_date,
-            COALESCE(p.name, 'No UW alumnus found') as alumnus_name,
-            COALESCE(p.title, '') as alumnus_title,
-            COALESCE(p.linkedin_url, '') as alumnus_linkedin
-        FROM internships i
-        LEFT JOIN profiles p ON LOWER(i.company) = LOWER(p.company)
-        ORDER BY i.discovered_date DESC
-        '''
+        conn = self.conn
         
-        cursor = conn.execute(query)
-        rows = cursor.fetchall()
+        # The LEFT JOIN yields rows exactly when there are internships, so probe
+        # for one instead of materialising the whole result set
+        has_rows = conn.execute(self._SQL_HAS_INTERNSHIPS).fetchone()[0]
         
-        if rows:
+        if has_rows:
             import csv
-            with open(self.config.OUTPUT_CSV, 'w', newline='', encoding='utf-8') as csvfile:
+            row_count = 0
+            # 1 MB buffer so the streamed rows reach disk in a few large writes
+            with open(self.config.OUTPUT_CSV, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow([
                     'Company', 'Role', 'Location', 'Application Link', 'Discovered Date',
                     'UW Alumnus', 'Alumnus Title', 'Alumnus LinkedIn'
                 ])
-                writer.writerows(rows)
+                # Join internships with profiles, streaming rows straight from the
+                # cursor so memory stays flat
+                for row in conn.execute(self._SQL_EXPORT):
+                    writer.writerow(row)
+                    row_count += 1
             
-            print(f"Exported {len(rows)} opportunities to {self.config.OUTPUT_CSV}")
+            print(f"Exported {row_count} opportunities to {self.config.OUTPUT_CSV}")
         else:
             print("No opportunities found to export")
-        
-        conn.close()
     
     def show_summary(self):
         """Show summary of found data"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
-        
-        # Get counts
-        internship_count = conn.execute("SELECT COUNT(*) FROM internships").fetchone()[0]
-        alumni_count = conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
-        
-        # Get weekly counts (last 7 days)
-        weekly_internships = conn.execute("""
-            SELECT COUNT(*) FROM internships 
-            WHERE discovered_date >= date('now', '-7 days')
-        """).fetchone()[0]
-        
-        weekly_alumni = conn.execute("""
-            SELECT COUNT(*) FROM profiles 
-            WHERE discovered_date >= date('now', '-7 days')
-        """).fetchone()[0]
-        
-        # Get top companies by internship count
-        top_companies = conn.execute("""
-            SELECT company, COUNT(*) as count 
-            FROM internships 
-            GROUP BY company 
-            ORDER BY count DESC 
-            LIMIT 5
-        """).fetchall()
+        conn = self.conn
         
-        conn.close()
+        rows = conn.execute(self._SQL_SUMMARY).fetchall()
+        totals = rows[0]
         
         print("\nSUMMARY REPORT")
         print("=" * 40)
-        print(f"Total Internships Found: {internship_count}")
-        print(f"Total UW Alumni Found: {alumni_count}")
-        print(f"New This Week: {weekly_internships} internships, {weekly_alumni} alumni")
+        print(f"Total Internships Found: {totals['internship_count']}")
+        print(f"Total UW Alumni Found: {totals['alumni_count']}")
+        print(f"New This Week: {totals['weekly_internships']} internships, {totals['weekly_alumni']} alumni")
         
-        if top_companies:
+        if totals['count'] is not None:
             print("Top Companies by Internship Count:")
-            for company, count in top_companies:
-                print(f"  • {company}: {count} internships")
+            for row in rows:
+                print(f"  • {row['company']}: {row['count']} internships")
     
-    def show_recent_alumni(self, limit=20, company=None):
+    def show_recent_alumni(self, limit=20, company=None, days=None):
         """Show recently found UW alumni"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
+        conn = self.conn
         
+        # Filters come from fixed fragments and every value is bound, so each
+        # combination maps to one reusable prepared statement
+        conditions, params = [], []
         if company:
-            query = """
-                SELECT name, title, company, linkedin_url, discovered_date 
-                FROM profiles 
-                WHERE LOWER(company) LIKE LOWER(?)
-                ORDER BY discovered_date DESC 
-                LIMIT ?
-            """
-            cursor = conn.execute(query, (f"%{company}%", limit))
-        else:
-            query = """
-                SELECT name, title, company, linkedin_url, discovered_date 
-                FROM profiles 
-                ORDER BY discovered_date DESC 
-                LIMIT ?
-            """
-            cursor = conn.execute(query, (limit,))
+            # LIKE already ignores ASCII case; with the leading % this is still a
+            # scan, a prefix pattern could use idx_*_company_date
+            conditions.append("company LIKE ?")
+            params.append(f"%{company}%")
+        if days is not None:
+            conditions.append("discovered_date > datetime('now', ?)")
+            params.append(f"-{days} days")
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        query = f"""
+            SELECT name, title, company, linkedin_url, discovered_date 
+            FROM profiles 
+            {where_clause}
+            ORDER BY discovered_date DESC 
+            LIMIT ?
+        """
+        cursor = conn.execute(query, (*params, limit))
         
         alumni = cursor.fetchall()
-        conn.close()
         
+        company_text = f" at {company}" if company else ""
+        window_text = f" in the Last {days} Days" if days is not None else ""
         if alumni:
-            print(f"\nUW Alumni Found{f' at {company}' if company else ' (Most Recent 20)'}:")
-            print("-" * 80)
-            for i, (name, title, comp, linkedin_url, discovered_date) in enumerate(alumni, 1):
-                print(f"{i:2d}. {name}")
-                print(f"    Title: {title}")
-                print(f"    Company: {comp}")
-                print(f"    LinkedIn: {linkedin_url}")
-                print(f"    Found: {discovered_date}")
-                print()
+            # Build the listing and write it once rather than print() per line
+            lines = [f"\nUW Alumni Found{company_text}{window_text} (Most Recent {len(alumni)}):", "-" * 80]
+            for i, row in enumerate(alumni, 1):
+                lines.append(f"{i:2d}. " + self._ALUMNUS_ENTRY.format_map(row))
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
-            company_text = f" at {company}" if company else ""
-            print(f"No UW alumni found{company_text}")
+            print(f"No UW alumni found{company_text}{window_text.lower()}")
     
-    def show_recent_internships(self, limit=20, company=None):
+    def show_recent_internships(self, limit=20, company=None, days=None):
         """Show recently found internships"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
+        conn = self.conn
         
+        # Filters come from fixed fragments and every value is bound, so each
+        # combination maps to one reusable prepared statement
+        conditions, params = [], []
         if company:
-            query = """
-                SELECT company, role, location, application_link, discovered_date 
-                FROM internships 
-                WHERE LOWER(company) LIKE LOWER(?)
-                ORDER BY discovered_date DESC 
-                LIMIT ?
-            """
-            cursor = conn.execute(query, (f"%{company}%", limit))
-        else:
-            query = """
-                SELECT company, role, location, application_link, discovered_date 
-                FROM internships 
-                ORDER BY discovered_date DESC 
-                LIMIT ?
-            """
-            cursor = conn.execute(query, (limit,))
+            # LIKE already ignores ASCII case; with the leading % this is still a
+            # scan, a prefix pattern could use idx_*_company_date
+            conditions.append("company LIKE ?")
+            params.append(f"%{company}%")
+        if days is not None:
+            conditions.append("discovered_date > datetime('now', ?)")
+            params.append(f"-{days} days")
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        query = f"""
+            SELECT company, role, location, application_link, discovered_date 
+            FROM internships 
+            {where_clause}
+            ORDER BY discovered_date DESC 
+            LIMIT ?
+        """
+        cursor = conn.execute(query, (*params, limit))
         
         internships = cursor.fetchall()
-        conn.close()
         
+        company_text = f" at {company}" if company else ""
+        window_text = f" in the Last {days} Days" if days is not None else ""
         if internships:
-            company_text = f" at {company}" if company else ""
-            print(f"\nRecent Internships{company_text} (Most Recent {min(limit, len(internships))}):")
-            print("-" * 80)
-            for i, (comp, role, location, app_link, discovered_date) in enumerate(internships, 1):
-                print(f"{i:2d}. {comp} - {role}")
-                print(f"    Location: {location}")
-                if app_link:
-                    print(f"    Apply: {app_link}")
-                print(f"    Found: {discovered_date}")
-                print()
+            # Build the listing and write it once rather than print() per line
+            lines = [f"\nRecent Internships{company_text}{window_text} (Most Recent {len(internships)}):", "-" * 80]
+            for i, row in enumerate(internships, 1):
+                entry = f"{i:2d}. " + self._INTERNSHIP_ENTRY.format_map(row)
+                if row['application_link']:
+                    entry += self._INTERNSHIP_APPLY.format_map(row)
+                lines.append(entry + self._INTERNSHIP_FOUND.format_map(row))
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
-            company_text = f" at {company}" if company else ""
-            print(f"No internships found{company_text}")
+            print(f"No internships found{company_text}{window_text.lower()}")
 
 def main():
     parser = argparse.ArgumentParser(description='UW Internship Finder - Monitor internships and find UW alumni')
@@ -242,7 +374,7 @@ def main():
         'enqueue', 'worker'
     ], help='Command to execute')
     parser.add_argument('--company', type=str, help='Company name for alumni search')
-    parser.add_argument('--days', type=int, default=7, help='Number of days for recent search')
+    parser.add_argument('--days', type=int, help='Only list entries found in the last N days (default: no limit)')
     parser.add_argument('--companies', nargs='+', help='Specific companies to scrape LinkedIn for')
     parser.add_argument('--instance-id', type=str, help='EC2 instance ID for start/stop operations')
     parser.add_argument('--region', type=str, help='AWS region to check (default: all regions)')
@@ -255,31 +387,36 @@ def main():
     
     if args.command == 'run':
         # Run one complete cycle
-        finder.run_full_cycle()
+        excel_updated = finder.run_full_cycle()
         finder.export_opportunities_to_csv()
         
-        # Always update Excel on manual run
-        print("\nUpdating Excel spreadsheet...")
-        finder.excel_integration.create_or_update_excel()
+        # Always update Excel on manual run, unless the cycle just rebuilt it
+        # (rebuilding again would also drop the alert the cycle added)
+        if not excel_updated:
+            print("\nUpdating Excel spreadsheet...")
+            finder.excel_integration.create_or_update_excel()
         
         finder.show_summary()
     
     elif args.command == 'monitor':
         # Start continuous monitoring
-        print("Starting continuous monitoring (every 12 hours)")
+        interval_seconds = finder.config.CHECK_INTERVAL_HOURS * 3600
+        print(f"Starting continuous monitoring (every {finder.config.CHECK_INTERVAL_HOURS} hours)")
         print("Press Ctrl+C to stop")
         
-        # Schedule the job
-        # schedule.every(finder.config.CHECK_INTERVAL_HOURS).hours.do(finder.run_full_cycle) # Removed schedule import
-        
-        # Run immediately once
-        finder.run_full_cycle()
+        # SIGTERM (docker stop, systemd) lets the current cycle finish and ends
+        # the wait for the next one immediately; Ctrl+C still interrupts at once
+        stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
         
-        # Then wait for scheduled runs
+        # Run immediately, then sleep straight through to the next cycle
+        # instead of waking up every minute to check whether one is due
         try:
-            while True:
-                # schedule.run_pending() # Removed schedule import
-                time.sleep(60)  # Check every minute
+            while not stop_event.is_set():
+                cycle_started = time.monotonic()
+                finder.run_full_cycle()
+                stop_event.wait(max(1, interval_seconds - (time.monotonic() - cycle_started)))
+            print("Monitoring stopped")
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user")
     
@@ -299,6 +436,7 @@ def main():
     
     elif args.command == 'enqueue':
         # Enqueue companies to Redis queue
+        from redis_queue import CompanyQueue
         queue = CompanyQueue()
         if args.companies:
             enqueued = 0
@@ -320,6 +458,7 @@ def main():
     
     elif args.command == 'worker':
         # Consume queue and scrape
+        from redis_queue import CompanyQueue
         queue = CompanyQueue()
         processed = 0
         print("Worker started. Waiting for jobs...")
@@ -346,10 +485,10 @@ def main():
         finder.show_summary()
     
     elif args.command == 'recent':
-        finder.show_recent_internships(args.days, args.company)
+        finder.show_recent_internships(company=args.company, days=args.days)
     
     elif args.command == 'alumni':
-        finder.show_recent_alumni(args.days, args.company)
+        finder.show_recent_alumni(company=args.company, days=args.days)
     
     elif args.command == 'export':
         finder.export_opportunities_to_csv()
@@ -4,31 +4,73 @@ AWS Setup Helper for UW Internship Finder
 Helps configure AWS credentials for EC2 monitoring
 """
 
+import functools
+import json
 import os
+import shutil
 import sys
 import subprocess
+import time
 from pathlib import Path
 
-def check_aws_cli():
-    """Check if AWS CLI is installed"""
+# The AWS helpers live in src/ (aws_monitor)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Instance metadata service (IMDSv2), reachable only from an EC2 instance
+IMDS_URL = "http://169.254.169.254/latest"
+
+# Last check_all_regions() result, reused by runs within REGION_CACHE_TTL seconds
+REGION_CACHE_FILE = Path.home() / '.cache' / 'uw-internship-finder' / 'regions.json'
+REGION_CACHE_TTL = 60
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """boto3 session shared by every AWS call in this script"""
+    from aws_monitor import create_session
+    return create_session()
+
+def _instance_account_id():
+    """Account of the EC2 instance this runs on, from its identity document"""
     try:
-        result = subprocess.run(['aws', '--version'], capture_output=True, text=True)
-        print(f"✅ AWS CLI found: {result.stdout.strip()}")
-        return True
-    except FileNotFoundError:
-        print("❌ AWS CLI not found")
-        return False
+        import requests
+        token = requests.put(f"{IMDS_URL}/api/token",
+                             headers={"X-aws-ec2-metadata-token-ttl-seconds": "60"}, timeout=0.5)
+        token.raise_for_status()
+        document = requests.get(f"{IMDS_URL}/dynamic/instance-identity/document",
+                                headers={"X-aws-ec2-metadata-token": token.text}, timeout=0.5)
+        document.raise_for_status()
+        return document.json().get('accountId')
+    except Exception:
+        return None
 
-def install_aws_cli():
-    """Install AWS CLI using pip"""
-    print("Installing AWS CLI...")
+def _load_region_status(account):
+    """Cached region scan for account, or None if absent or stale"""
     try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'awscli'])
-        print("✅ AWS CLI installed successfully")
+        cached = json.loads(REGION_CACHE_FILE.read_text())
+        if account and cached['account'] == account and time.time() - cached['fetched_at'] < REGION_CACHE_TTL:
+            return cached['status']
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def _save_region_status(account, status):
+    """Cache a successful region scan for account"""
+    if not account or 'error' in status:
+        return
+    try:
+        REGION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        REGION_CACHE_FILE.write_text(json.dumps({'account': account, 'fetched_at': time.time(), 'status': status}))
+    except OSError:
+        pass
+
+def check_aws_cli():
+    """Check if AWS CLI is installed (only needed for `aws configure`)"""
+    path = shutil.which('aws')
+    if path:
+        print(f"✅ AWS CLI found: {path}")
         return True
-    except subprocess.CalledProcessError:
-        print("❌ Failed to install AWS CLI")
-        return False
+    print("ℹ️  AWS CLI not found (optional - boto3 covers everything this project uses)")
+    return False
 
 def check_boto3():
     """Check if boto3 is installed"""
@@ -52,16 +94,25 @@ def install_boto3():
         return False
 
 def check_aws_credentials():
-    """Check if AWS credentials are configured"""
+    """Check if AWS credentials are configured
+    Returns the caller identity (at least 'Account') if they work, else None.
+    """
     try:
-        import boto3
-        client = boto3.client('sts')
-        response = client.get_caller_identity()
-        print(f"✅ AWS credentials configured for account: {response.get('Account', 'Unknown')}")
-        return True
+        # On EC2 with an instance role, botocore just fetched working credentials
+        # from the local metadata service, which also knows the account
+        credentials = _get_session().get_credentials()
+        account_id = _instance_account_id() if getattr(credentials, 'method', None) == 'iam-role' else None
+        if account_id:
+            identity = {'Account': account_id}
+        else:
+            identity = _get_session().client('sts').get_caller_identity()
+        print(f"✅ AWS credentials configured for account: {identity.get('Account', 'Unknown')}")
+        return identity
     except Exception as e:
+        # Resolve credentials from scratch next time, e.g. after `aws configure`
+        _get_session.cache_clear()
         print(f"❌ AWS credentials not configured: {e}")
-        return False
+        return None
 
 def setup_aws_credentials():
     """Guide user through AWS credential setup"""
@@ -106,44 +157,50 @@ def setup_aws_credentials():
     
     return False
 
-def test_ec2_connection():
-    """Test connection to EC2"""
+def test_ec2_connection(identity=None):
+    """Test connection to EC2
+    identity is check_aws_credentials()'s result, when the caller already has it.
+    """
     print("\n🔍 Testing EC2 connection...")
     try:
-        # Add current directory to path for imports
-        current_dir = Path(__file__).parent.parent
-        sys.path.insert(0, str(current_dir / 'src'))
-        
         from aws_monitor import EC2Monitor
         
-        monitor = EC2Monitor()
+        monitor = EC2Monitor(session=_get_session())
         
-        # Try to get regions (this requires minimal permissions)
-        if monitor._get_aws_credentials():
+        # A scan of this account from the last minute is reused without calling AWS
+        account = (identity or {}).get('Account')
+        status = _load_region_status(account)
+        if status is not None:
+            print("✅ Successfully connected to AWS! (cached)")
+        # Try to get regions (this requires minimal permissions); not needed
+        # when the credentials were just verified
+        elif identity or monitor._get_aws_credentials():
             print("✅ Successfully connected to AWS!")
             
             # Try to get status
             status = monitor.check_all_regions()
-            if 'error' not in status:
-                print(f"✅ Found {status['total_instances']} EC2 instances across {status['regions_with_instances']} regions")
-                
-                if status['total_instances'] > 0:
-                    print("\nInstance Summary:")
-                    print(f"   Running: {status['total_running']} 🟢")
-                    print(f"   Stopped: {status['total_stopped']} 🔴")
-                    
-                    # Show first few instances
-                    for region_data in status['regions'][:2]:  # Show first 2 regions
-                        print(f"\n   Region: {region_data['region']}")
-                        for instance in region_data['instances'][:3]:  # Show first 3 instances
-                            status_emoji = "🟢" if instance['state'] == 'running' else "🔴"
-                            print(f"     {status_emoji} {instance['name']} ({instance['instance_id']})")
+            _save_region_status(account, status)
+        else:
+            return False
+        
+        if 'error' not in status:
+            print(f"✅ Found {status['total_instances']} EC2 instances across {status['regions_with_instances']} regions")
+            
+            if status['total_instances'] > 0:
+                print("\nInstance Summary:")
+                print(f"   Running: {status['total_running']} 🟢")
+                print(f"   Stopped: {status['total_stopped']} 🔴")
                 
-                return True
-            else:
-                print(f"❌ Error checking EC2: {status['error']}")
-                return False
+                # Show first few instances
+                for region_data in status['regions'][:2]:  # Show first 2 regions
+                    print(f"\n   Region: {region_data['region']}")
+                    for instance in region_data['instances'][:3]:  # Show first 3 instances
+                        status_emoji = "🟢" if instance['state'] == 'running' else "🔴"
+                        print(f"     {status_emoji} {instance['name']} ({instance['instance_id']})")
+            
+            return True
         else:
+            print(f"❌ Error checking EC2: {status['error']}")
             return False
             
     except Exception as e:
@@ -154,28 +211,28 @@ def main():
     print("🚀 AWS Setup for UW Internship Finder")
     print("="*50)
     
-    # Check dependencies
+    # Check dependencies; the CLI is only a convenience for entering credentials
     if not check_aws_cli():
-        if not install_aws_cli():
-            print("Please install AWS CLI manually: pip install awscli")
-            return
+        print("   Install it to use 'aws configure', or set credentials via environment variables")
     
     if not check_boto3():
         if not install_boto3():
             print("Please install boto3 manually: pip install boto3")
             return
     
-    # Check credentials
-    if not check_aws_credentials():
+    # Check credentials once; only re-check if they had to be set up
+    identity = check_aws_credentials()
+    if identity is None:
         setup_aws_credentials()
         
         # Re-check after setup
-        if not check_aws_credentials():
+        identity = check_aws_credentials()
+        if identity is None:
             print("\n❌ Credentials still not working. Please check your setup.")
             return
     
     # Test EC2 connection
-    if test_ec2_connection():
+    if test_ec2_connection(identity):
         print("\n🎉 AWS setup complete!")
         print("\nYou can now use these commands:")
         print("   python3 main.py aws-status          # Check all EC2 instances")
@@ -6,9 +6,41 @@ Downloads latest findings from EC2 instance to local environment
 
 import subprocess
 import os
+import shlex
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Multiplex SSH sessions to the instance over one connection, so the status
+# check reuses the connection the file sync just opened
+SSH_MULTIPLEX_OPTIONS = "-o ControlMaster=auto -o ControlPath=~/.ssh/cm-%r@%h:%p -o ControlPersist=60s"
+
+def safe_stat(path):
+    """os.stat() result for path, or None if it doesn't exist (one syscall
+    where exists() + getsize() take two)"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def count_lines(path):
+    """Count newlines in a file 1 MB at a time instead of building a list of lines"""
+    with open(path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+
+def _parse_rsync_errors(stderr, remote_path, filenames):
+    """Map each of filenames that rsync reported a problem with to the
+    "rsync:" error line naming its remote path"""
+    error_lines = [line for line in stderr.splitlines() if line.startswith("rsync:")]
+    errors = {}
+    for filename in filenames:
+        error = next((line for line in error_lines if f"{remote_path}/{filename}" in line), None)
+        if error is not None:
+            errors[filename] = error
+    return errors
+
 def run_command(command, description):
     """Run a shell command and return success status"""
     print(f"📥 {description}...")
@@ -49,12 +81,63 @@ def sync_from_ec2():
         (".env", "Environment configuration"),
     ]
     
-    success_count = 0
+    synced = []
+    
+    if shutil.which("rsync"):
+        # One rsync (one SSH handshake) for every file instead of an scp each;
+        # a file missing on the instance is reported and the rest still transfer
+        print(f"📥 Downloading {len(files_to_sync)} files...")
+        sources = [f"ubuntu@{ec2_host}:{remote_path}/{filename}" for filename, _ in files_to_sync]
+        result = subprocess.run(
+            ["rsync", "-az", "-e", f"ssh -i {os.path.expanduser(key_file)} {SSH_MULTIPLEX_OPTIONS}", *sources, "."],
+            capture_output=True, text=True
+        )
+        # 23/24: partial transfer, some files failed (missing, unreadable, I/O
+        # error) or vanished; rsync names each failed path in an "rsync:" line
+        if result.returncode in (0, 23, 24):
+            errors = _parse_rsync_errors(result.stderr, remote_path, [filename for filename, _ in files_to_sync])
+            for filename, description in files_to_sync:
+                error = errors.get(filename)
+                if error is None and safe_stat(filename) is None:
+                    error = "no local copy after transfer"
+                if error is not None:
+                    print(f"❌ Downloading {filename} ({description}) failed: {error}")
+                else:
+                    print(f"✅ Downloading {filename} ({description}) completed")
+                    synced.append(filename)
+        else:
+            print(f"❌ Download failed: {result.stderr}")
+    else:
+        # Open the shared SSH connection up front, then copy the files over it
+        # concurrently rather than one scp (and one handshake) after another.
+        # Compression is a property of that connection (scp -C would have no
+        # effect through it); the database, workbook and log all compress
+        # well, like rsync -z does above
+        ssh_target = f"-i {key_file} {SSH_MULTIPLEX_OPTIONS} ubuntu@{ec2_host}"
+        # The backgrounded master keeps whatever stderr it was given open, so
+        # that is a file rather than a pipe run() would wait on until it exits
+        with tempfile.TemporaryFile(mode='w+') as master_errors:
+            master = subprocess.run(f"ssh -C {ssh_target} -fN", shell=True,
+                                    stdout=subprocess.DEVNULL, stderr=master_errors)
+            master_errors.seek(0)
+            master_error_text = master_errors.read().strip()
+        if master.returncode != 0:
+            print(f"❌ Could not connect to EC2: {master_error_text}")
+        else:
+            def download(file_to_sync):
+                filename, description = file_to_sync
+                command = f"scp -i {key_file} {SSH_MULTIPLEX_OPTIONS} ubuntu@{ec2_host}:{remote_path}/{filename} ."
+                return run_command(command, f"Downloading {filename} ({description})")
+            
+            try:
+                with ThreadPoolExecutor(max_workers=len(files_to_sync)) as executor:
+                    results = list(executor.map(download, files_to_sync))
+                synced = [filename for (filename, _), ok in zip(files_to_sync, results) if ok]
+            finally:
+                # Close the master now rather than leaving it for ControlPersist
+                subprocess.run(f"ssh {ssh_target} -O exit", shell=True, capture_output=True)
     
-    for filename, description in files_to_sync:
-        command = f"scp -i {key_file} ubuntu@{ec2_host}:{remote_path}/{filename} ."
-        if run_command(command, f"Downloading {filename} ({description})"):
-            success_count += 1
+    success_count = len(synced)
     
     print(f"\n📊 Sync Summary")
     print("=" * 20)
@@ -62,10 +145,10 @@ def sync_from_ec2():
     
     if success_count > 0:
         print(f"\n📁 Downloaded files:")
-        for filename, _ in files_to_sync[:success_count]:
-            if os.path.exists(filename):
-                size = os.path.getsize(filename)
-                print(f"  • {filename} ({size:,} bytes)")
+        for filename in synced:
+            st = safe_stat(filename)
+            if st:
+                print(f"  • {filename} ({st.st_size:,} bytes)")
     
     print(f"\n⏰ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     return success_count == len(files_to_sync)
@@ -84,19 +167,37 @@ def check_ec2_status():
         ("tail -5 scraper.log", "Recent log entries"),
     ]
     
-    for command, description in status_commands:
+    # Run all of them in one SSH session, each output preceded by a marker line
+    marker = "---STATUS-SECTION---"
+    remote_script = "cd Internship-Filter && { " + " ".join(
+        f"echo {marker}; {command};" for command, _ in status_commands
+    ) + " }"
+    # An argv list, so the remote script reaches ssh as one argument with no
+    # local shell quoting in between
+    ssh_command = ["ssh", "-i", os.path.expanduser(key_file), *shlex.split(SSH_MULTIPLEX_OPTIONS),
+                   f"ubuntu@{ec2_host}", remote_script]
+    result = subprocess.run(ssh_command, capture_output=True, text=True)
+    sections = result.stdout.split(f"{marker}\n")[1:]
+    
+    missing = False
+    for i, (command, description) in enumerate(status_commands):
         print(f"\n📋 {description}:")
-        ssh_command = f"ssh -i {key_file} ubuntu@{ec2_host} 'cd Internship-Filter && {command}'"
-        result = subprocess.run(ssh_command, shell=True, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            # Clean up the output
-            output = result.stdout.strip()
+        # Clean up the output
+        output = sections[i].strip() if i < len(sections) else ""
+        if output:
             for line in output.split('\n'):
                 if line.strip():
                     print(f"  {line}")
         else:
             print(f"  ❌ Failed to get {description.lower()}")
+            missing = True
+    
+    # stderr is shared by the whole session, so show it once when anything failed
+    errors = result.stderr.strip()
+    if errors and (result.returncode != 0 or missing):
+        print(f"\n⚠️  Errors (ssh exit code {result.returncode}):")
+        for line in errors.split('\n'):
+            print(f"  {line}")
 
 def show_local_summary():
     """Show summary of local data after sync"""
@@ -109,37 +210,44 @@ def show_local_summary():
         if os.path.exists("internship_tracker.db"):
             conn = sqlite3.connect("internship_tracker.db")
             
-            # Get counts
-            internship_count = conn.execute('SELECT COUNT(*) FROM internships').fetchone()[0]
-            profile_count = conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+            # Counts and top companies in one statement: every row repeats the
+            # counts, and with no internships there is one row with a NULL company
+            rows = conn.execute('''
+                WITH counts AS (
+                    SELECT
+                        (SELECT COUNT(*) FROM internships) AS internship_count,
+                        (SELECT COUNT(*) FROM profiles) AS profile_count
+                ),
+                top_companies AS (
+                    SELECT company, COUNT(*) as count 
+                    FROM internships 
+                    GROUP BY company 
+                    ORDER BY count DESC 
+                    LIMIT 3
+                )
+                SELECT counts.*, top_companies.company, top_companies.count
+                FROM counts LEFT JOIN top_companies
+                ORDER BY top_companies.count DESC
+            ''').fetchall()
+            internship_count, profile_count = rows[0][:2]
             
             print(f"📈 Database contents:")
             print(f"  • Total internships: {internship_count}")
             print(f"  • UW alumni found: {profile_count}")
             
-            # Recent internships
-            recent = conn.execute('''
-                SELECT company, COUNT(*) as count 
-                FROM internships 
-                GROUP BY company 
-                ORDER BY count DESC 
-                LIMIT 3
-            ''').fetchall()
-            
-            if recent:
+            if rows[0][3] is not None:
                 print(f"\n🏆 Top companies by internship count:")
-                for company, count in recent:
+                for _, _, company, count in rows:
                     print(f"  • {company}: {count} internships")
             
             conn.close()
             
-        if os.path.exists("UW_Internship_Tracker.xlsx"):
-            size = os.path.getsize("UW_Internship_Tracker.xlsx")
-            print(f"\n📄 Excel file: UW_Internship_Tracker.xlsx ({size:,} bytes)")
+        st = safe_stat("UW_Internship_Tracker.xlsx")
+        if st:
+            print(f"\n📄 Excel file: UW_Internship_Tracker.xlsx ({st.st_size:,} bytes)")
             
         if os.path.exists("found_opportunities.csv"):
-            with open("found_opportunities.csv", 'r') as f:
-                lines = len(f.readlines()) - 1  # Subtract header
+            lines = count_lines("found_opportunities.csv") - 1  # Subtract header
             print(f"📄 CSV file: {lines} opportunities")
             
     except Exception as e:
@@ -5,27 +5,110 @@ Check EC2 instance status and integrate with Excel reports
 """
 
 import boto3
+import botocore.session
+import io
 import os
+import sys
 import json
+import time
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.config import Config as BotoConfig
+from botocore.credentials import JSONFileCache
 from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
 
+try:
+    import orjson  # optional: serializes --json output in C
+except ImportError:
+    orjson = None
+
+# Same directory the AWS CLI caches assumed-role credentials in
+AWS_CLI_CACHE_DIR = os.path.expanduser(os.path.join('~', '.aws', 'cli', 'cache'))
+
+# Regions queried at once by check_all_regions()
+REGION_SCAN_WORKERS = 16
+
+# Regions enabled for the account as (time.monotonic() when fetched, names).
+# That list changes on the order of months, so it is re-fetched at most daily
+REGION_LIST_TTL_SECONDS = 24 * 3600
+_enabled_regions = (0.0, None)
+
+# Everything but 'terminated': terminated instances stay listed for about an
+# hour but can't be started, stopped or billed, so EC2 filters them out for us
+LIVE_INSTANCE_STATES = ['pending', 'running', 'shutting-down', 'stopping', 'stopped']
+
+# Basic pricing estimates (US regions, subject to change), built once rather
+# than on every get_instance_costs() call
+INSTANCE_PRICING = {
+    't2.nano': 0.0058,      # per hour
+    't2.micro': 0.0116,     # per hour
+    't2.small': 0.023,      # per hour
+    't2.medium': 0.046,     # per hour
+    't2.large': 0.093,      # per hour
+    't3.nano': 0.0052,
+    't3.micro': 0.0104,
+    't3.small': 0.021,
+    't3.medium': 0.042,
+    't3.large': 0.083,
+}
+DEFAULT_HOURLY_RATE = INSTANCE_PRICING['t2.micro']  # for types not listed
+
+# Report marker per instance state; any other state is shown as 🟡
+_STATE_EMOJI = {'running': "🟢", 'stopped': "🔴"}
+
+# Adaptive retries back off client-side when EC2 throttles (more likely with
+# many regions in flight); keepalive keeps pooled connections usable between calls
+EC2_CLIENT_CONFIG = BotoConfig(retries={'max_attempts': 5, 'mode': 'adaptive'}, tcp_keepalive=True)
+
+def create_session() -> boto3.Session:
+    """boto3 session whose assume-role credentials are cached on disk
+    
+    Profiles that assume a role (optionally with MFA) would otherwise call
+    STS, and prompt for a code, on every run; with the CLI's cache they reuse
+    the temporary credentials until they expire, shared with the `aws` CLI.
+    """
+    session = botocore.session.get_session()
+    assume_role = session.get_component('credential_provider').get_provider('assume-role')
+    if assume_role is not None:
+        assume_role.cache = JSONFileCache(AWS_CLI_CACHE_DIR)
+    return boto3.Session(botocore_session=session)
+
 class EC2Monitor:
-    def __init__(self):
+    def __init__(self, session: Optional[boto3.Session] = None):
         self.logger = logging.getLogger(__name__)
+        # Clients come from one session, so credentials are resolved once; callers
+        # that already hold a session (e.g. setup_aws.py) can pass it in
+        self.session = session or create_session()
         self.ec2_client = None
+        self._clients = {}
+        self._credentials_verified = False
+        # Regions found by _find_instance_region(), keyed by instance ID
+        self._instance_regions = {}
         self.instance_data = []
+    
+    def _client(self, region_name: Optional[str] = None):
+        """EC2 client for region_name (the default region if None), created once
+        so later calls reuse its endpoint resolution and open connections"""
+        client = self._clients.get(region_name)
+        if client is None:
+            client = self.session.client('ec2', region_name=region_name, config=EC2_CLIENT_CONFIG)
+            self._clients[region_name] = client
+        return client
         
     def _get_aws_credentials(self) -> bool:
         """Check if AWS credentials are configured"""
         try:
             # Try to create EC2 client
-            self.ec2_client = boto3.client('ec2')
+            self.ec2_client = self._client()
             
-            # Test credentials by making a simple call
-            self.ec2_client.describe_regions()
+            # Test credentials by making a simple call, once per monitor; after
+            # that a credentials problem surfaces from the real call itself
+            if not self._credentials_verified:
+                self._describe_regions()
+                self._credentials_verified = True
             return True
             
         except NoCredentialsError:
@@ -40,64 +123,119 @@ class EC2Monitor:
             print(f"❌ Error connecting to AWS: {e}")
             return False
     
+    def _describe_regions(self) -> List[str]:
+        """Fetch the enabled regions, refreshing the shared region list"""
+        global _enabled_regions
+        response = self.ec2_client.describe_regions()
+        regions = [region['RegionName'] for region in response['Regions']]
+        _enabled_regions = (time.monotonic(), regions)
+        return regions
+    
+    def _list_regions(self) -> List[str]:
+        """Enabled regions, from the shared list unless it is missing or stale"""
+        fetched_at, regions = _enabled_regions
+        if regions is None or time.monotonic() - fetched_at > REGION_LIST_TTL_SECONDS:
+            regions = self._describe_regions()
+        return regions
+    
+    def _find_instance_region(self, instance_id: str) -> Optional[str]:
+        """Region holding instance_id, or None if no enabled region has it
+        All regions are asked at once and the search stops at the first hit;
+        the answer is remembered for later start/stop calls.
+        """
+        region = self._instance_regions.get(instance_id)
+        if region is not None:
+            return region
+        
+        def lookup(client) -> Optional[str]:
+            try:
+                client.describe_instances(InstanceIds=[instance_id])
+                return client.meta.region_name
+            except ClientError:
+                # InvalidInstanceID.NotFound in every region but its own
+                return None
+            except BotoCoreError as e:
+                # An unreachable region shouldn't stop the others from answering
+                self.logger.debug(f"Instance lookup in {client.meta.region_name} failed: {e}")
+                return None
+        
+        # Built up front, as in check_all_regions(), since the session isn't thread-safe
+        clients = [self._client(region) for region in self._list_regions()]
+        executor = ThreadPoolExecutor(max_workers=REGION_SCAN_WORKERS)
+        try:
+            futures = [executor.submit(lookup, client) for client in clients]
+            for future in as_completed(futures):
+                region = future.result()
+                if region is not None:
+                    self._instance_regions[instance_id] = region
+                    return region
+            return None
+        finally:
+            # Regions not yet asked are dropped once the instance is found
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def check_ec2_instances(self, region_name: str = None) -> Dict:
         """Check status of all EC2 instances"""
         if not self._get_aws_credentials():
             return {"error": "AWS credentials not configured", "instances": []}
         
+        # If no region specified, check current region or default to us-west-2
+        if region_name:
+            self.ec2_client = self._client(region_name)
+        
+        summary = self._check_region(self.ec2_client)
+        if 'error' not in summary:
+            # Store for Excel integration
+            self.instance_data = summary['instances']
+        return summary
+    
+    def _check_region(self, client) -> Dict:
+        """Summarize the instances in client's region
+        Touches no shared state, so regions can be checked from worker threads.
+        """
         try:
-            # If no region specified, check current region or default to us-west-2
-            if region_name:
-                self.ec2_client = boto3.client('ec2', region_name=region_name)
-            
-            # Get all instances
-            response = self.ec2_client.describe_instances()
+            # Get all instances, page by page so accounts with more instances
+            # than one response holds (1000) aren't silently cut off
+            pages = client.get_paginator('describe_instances').paginate(
+                Filters=[{'Name': 'instance-state-name', 'Values': LIVE_INSTANCE_STATES}],
+                PaginationConfig={'PageSize': 1000}
+            )
+            reservations = (reservation for page in pages for reservation in page['Reservations'])
             
             instances = []
-            total_running = 0
-            total_stopped = 0
-            total_instances = 0
             
-            for reservation in response['Reservations']:
+            for reservation in reservations:
                 for instance in reservation['Instances']:
-                    total_instances += 1
-                    
                     # Get instance name from tags
-                    instance_name = "No Name"
-                    for tag in instance.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            instance_name = tag['Value']
-                            break
-                    
-                    state = instance['State']['Name']
-                    if state == 'running':
-                        total_running += 1
-                    elif state == 'stopped':
-                        total_stopped += 1
+                    instance_name = next((tag['Value'] for tag in instance.get('Tags', ()) if tag['Key'] == 'Name'), "No Name")
+                    launch_time = instance.get('LaunchTime')
                     
                     instance_info = {
                         'instance_id': instance['InstanceId'],
                         'name': instance_name,
-                        'state': state,
+                        'state': instance['State']['Name'],
                         'instance_type': instance['InstanceType'],
                         'public_ip': instance.get('PublicIpAddress', 'N/A'),
                         'private_ip': instance.get('PrivateIpAddress', 'N/A'),
-                        'launch_time': instance.get('LaunchTime', '').strftime('%Y-%m-%d %H:%M:%S') if instance.get('LaunchTime') else 'N/A',
+                        'launch_time': launch_time.strftime('%Y-%m-%d %H:%M:%S') if launch_time else 'N/A',
                         'availability_zone': instance['Placement']['AvailabilityZone'],
                         'vpc_id': instance.get('VpcId', 'N/A'),
                         'security_groups': [sg['GroupName'] for sg in instance.get('SecurityGroups', [])],
                         'key_name': instance.get('KeyName', 'N/A'),
                         'monitoring': instance['Monitoring']['State'],
-                        'region': self.ec2_client.meta.region_name
+                        'region': client.meta.region_name
                     }
                     instances.append(instance_info)
             
-            # Store for Excel integration
-            self.instance_data = instances
+            # Tallied in one C-level pass rather than branching per instance
+            state_counts = Counter(instance['state'] for instance in instances)
+            total_instances = len(instances)
+            total_running = state_counts['running']
+            total_stopped = state_counts['stopped']
             
             summary = {
                 'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
-                'region': self.ec2_client.meta.region_name,
+                'region': client.meta.region_name,
                 'total_instances': total_instances,
                 'running': total_running,
                 'stopped': total_stopped,
@@ -124,8 +262,7 @@ class EC2Monitor:
         
         try:
             # Get all regions
-            regions_response = self.ec2_client.describe_regions()
-            regions = [region['RegionName'] for region in regions_response['Regions']]
+            regions = self._list_regions()
             
             all_results = []
             total_instances = 0
@@ -134,17 +271,26 @@ class EC2Monitor:
             
             print(f"🔍 Checking {len(regions)} AWS regions...")
             
-            for region in regions:
-                print(f"   Checking {region}...")
-                result = self.check_ec2_instances(region)
-                
+            # Each region is a separate round trip, so query them concurrently.
+            # Clients are thread-safe but the session creating them isn't, so
+            # they are all built here first
+            clients = [self._client(region) for region in regions]
+            with ThreadPoolExecutor(max_workers=REGION_SCAN_WORKERS) as executor:
+                results = list(executor.map(self._check_region, clients))
+            
+            instances = []
+            for result in results:
                 if 'error' not in result:
                     if result['total_instances'] > 0:
                         all_results.append(result)
+                        instances.extend(result['instances'])
                         total_instances += result['total_instances']
                         total_running += result['running']
                         total_stopped += result['stopped']
-                
+            
+            # Store for Excel integration
+            self.instance_data = instances
+            
             return {
                 'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
                 'total_regions_checked': len(regions),
@@ -166,8 +312,10 @@ class EC2Monitor:
             return {"error": "AWS credentials not configured"}
         
         try:
+            # Without a region, look the instance up rather than assuming the default one
+            region_name = region_name or self._find_instance_region(instance_id)
             if region_name:
-                self.ec2_client = boto3.client('ec2', region_name=region_name)
+                self.ec2_client = self._client(region_name)
             
             response = self.ec2_client.start_instances(InstanceIds=[instance_id])
             
@@ -190,8 +338,10 @@ class EC2Monitor:
             return {"error": "AWS credentials not configured"}
         
         try:
+            # Without a region, look the instance up rather than assuming the default one
+            region_name = region_name or self._find_instance_region(instance_id)
             if region_name:
-                self.ec2_client = boto3.client('ec2', region_name=region_name)
+                self.ec2_client = self._client(region_name)
             
             response = self.ec2_client.stop_instances(InstanceIds=[instance_id])
             
@@ -215,26 +365,12 @@ class EC2Monitor:
         if not self.instance_data:
             return {"error": "No instance data available. Run check_ec2_instances first."}
         
-        # Basic pricing estimates (US regions, subject to change)
-        instance_pricing = {
-            't2.nano': 0.0058,      # per hour
-            't2.micro': 0.0116,     # per hour
-            't2.small': 0.023,      # per hour
-            't2.medium': 0.046,     # per hour
-            't2.large': 0.093,      # per hour
-            't3.nano': 0.0052,
-            't3.micro': 0.0104,
-            't3.small': 0.021,
-            't3.medium': 0.042,
-            't3.large': 0.083,
-        }
-        
         total_estimated_cost = 0
         instance_costs = []
         
         for instance in self.instance_data:
             instance_type = instance['instance_type']
-            hourly_rate = instance_pricing.get(instance_type, 0.0116)  # Default to t2.micro
+            hourly_rate = INSTANCE_PRICING.get(instance_type, DEFAULT_HOURLY_RATE)
             
             if instance['state'] == 'running':
                 daily_cost = hourly_rate * 24
@@ -265,49 +401,59 @@ class EC2Monitor:
             print(f"❌ Error: {status_data['error']}")
             return
         
-        print("\n" + "="*60)
-        print("🖥️  AWS EC2 INSTANCE STATUS REPORT")
-        print("="*60)
+        # Lines are collected and written in one go instead of a print() per line
+        out = io.StringIO()
+        print("\n" + "="*60, file=out)
+        print("🖥️  AWS EC2 INSTANCE STATUS REPORT", file=out)
+        print("="*60, file=out)
         
         if 'regions' in status_data:  # Multi-region report
-            print(f"📊 Summary:")
-            print(f"   • Total Regions Checked: {status_data['total_regions_checked']}")
-            print(f"   • Regions with Instances: {status_data['regions_with_instances']}")
-            print(f"   • Total Instances: {status_data['total_instances']}")
-            print(f"   • Running: {status_data['total_running']} 🟢")
-            print(f"   • Stopped: {status_data['total_stopped']} 🔴")
-            print(f"   • Checked: {status_data['timestamp']}")
+            print(f"📊 Summary:", file=out)
+            print(f"   • Total Regions Checked: {status_data['total_regions_checked']}", file=out)
+            print(f"   • Regions with Instances: {status_data['regions_with_instances']}", file=out)
+            print(f"   • Total Instances: {status_data['total_instances']}", file=out)
+            print(f"   • Running: {status_data['total_running']} 🟢", file=out)
+            print(f"   • Stopped: {status_data['total_stopped']} 🔴", file=out)
+            print(f"   • Checked: {status_data['timestamp']}", file=out)
             
             for region_data in status_data['regions']:
-                print(f"\n📍 Region: {region_data['region']}")
-                self._print_instances(region_data['instances'])
+                print(f"\n📍 Region: {region_data['region']}", file=out)
+                self._print_instances(region_data['instances'], out)
                 
         else:  # Single region report
-            print(f"📍 Region: {status_data['region']}")
+            print(f"📍 Region: {status_data['region']}", file=out)
             print(f"📊 Summary: {status_data['total_instances']} total, "
                   f"{status_data['running']} running 🟢, "
-                  f"{status_data['stopped']} stopped 🔴")
-            print(f"⏰ Checked: {status_data['timestamp']}")
+                  f"{status_data['stopped']} stopped 🔴", file=out)
+            print(f"⏰ Checked: {status_data['timestamp']}", file=out)
             
-            self._print_instances(status_data['instances'])
+            self._print_instances(status_data['instances'], out)
         
-        print("\n" + "="*60)
+        print("\n" + "="*60, file=out)
+        sys.stdout.write(out.getvalue())
     
-    def _print_instances(self, instances: List[Dict]):
-        """Helper method to print instance details"""
+    def _print_instances(self, instances: List[Dict], out):
+        """Helper method to print instance details to out"""
         if not instances:
-            print("   No instances found in this region.")
+            print("   No instances found in this region.", file=out)
             return
         
         for instance in instances:
-            status_emoji = "🟢" if instance['state'] == 'running' else "🔴" if instance['state'] == 'stopped' else "🟡"
-            print(f"\n   {status_emoji} {instance['name']} ({instance['instance_id']})")
-            print(f"      Type: {instance['instance_type']}")
-            print(f"      State: {instance['state']}")
-            print(f"      Public IP: {instance['public_ip']}")
-            print(f"      Zone: {instance['availability_zone']}")
+            status_emoji = _STATE_EMOJI.get(instance['state'], "🟡")
+            print(f"\n   {status_emoji} {instance['name']} ({instance['instance_id']})", file=out)
+            print(f"      Type: {instance['instance_type']}", file=out)
+            print(f"      State: {instance['state']}", file=out)
+            print(f"      Public IP: {instance['public_ip']}", file=out)
+            print(f"      Zone: {instance['availability_zone']}", file=out)
             if instance['launch_time'] != 'N/A':
-                print(f"      Launched: {instance['launch_time']}")
+                print(f"      Launched: {instance['launch_time']}", file=out)
+
+
+def to_json(data) -> str:
+    """data as indented JSON, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
 
 
 def main():
@@ -328,7 +474,7 @@ def main():
     if args.start:
         result = monitor.start_instance(args.start, args.region)
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(to_json(result))
         else:
             if 'error' in result:
                 print(f"❌ {result['error']}")
@@ -339,7 +485,7 @@ def main():
     if args.stop:
         result = monitor.stop_instance(args.stop, args.region)
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(to_json(result))
         else:
             if 'error' in result:
                 print(f"❌ {result['error']}")
@@ -354,7 +500,7 @@ def main():
         status_data = monitor.check_all_regions()
     
     if args.json:
-        print(json.dumps(status_data, indent=2))
+        print(to_json(status_data))
     else:
         monitor.print_status_report(status_data)
         
@@ -15,13 +15,14 @@ class Config:
     # Target Settings
     TARGET_COLLEGE = "University of Washington"
     TARGET_LOCATION = "Seattle"
-    PREFERRED_LOCATIONS = ["Seattle", "Bellevue", "Redmond", "Remote", "United States"]
+    PREFERRED_LOCATIONS = ("Seattle", "Bellevue", "Redmond", "Remote", "United States")
+    PREFERRED_LOCATIONS_LOWER = tuple(loc.lower() for loc in PREFERRED_LOCATIONS)
     
     # GitHub Repositories to Monitor
-    GITHUB_REPOS = [
+    GITHUB_REPOS = (
         "https://github.com/SimplifyJobs/Summer2026-Internships.git",
         "https://github.com/speedyapply/2026-SWE-College-Jobs.git"
-    ]
+    )
     
     # Monitoring Settings
     CHECK_INTERVAL_HOURS = 6
@@ -31,20 +32,39 @@ class Config:
     REQUEST_DELAY_MIN = 3.0  # Conservative delays for personal use
     REQUEST_DELAY_MAX = 6.0
     MAX_PAGES_PER_SEARCH = 5
+    # Companies with alumni saved within this many days are not searched again
+    ALUMNI_RESCAN_DAYS = 30
+    # Parallel browser sessions for LinkedIn search; all share one account, so
+    # keep this low (1 = sequential)
+    LINKEDIN_WORKERS = int(os.getenv('LINKEDIN_WORKERS', '1'))
+    # Search over HTTP with the browser's session cookies (falls back to Selenium)
+    LINKEDIN_USE_API = os.getenv('LINKEDIN_USE_API', 'false').lower() == 'true'
+    # Companies searched at once over that HTTP session
+    LINKEDIN_API_CONCURRENCY = int(os.getenv('LINKEDIN_API_CONCURRENCY', '4'))
+    # Cap on HTTP search requests per second across those concurrent searches
+    LINKEDIN_API_REQUESTS_PER_SECOND = float(os.getenv('LINKEDIN_API_REQUESTS_PER_SECOND', '1'))
+    # Hand new companies to the Redis queue for `worker` processes instead of
+    # searching them in the monitoring process
+    LINKEDIN_USE_QUEUE = os.getenv('LINKEDIN_USE_QUEUE', 'false').lower() == 'true'
+    # Type login credentials in small timed chunks instead of one send_keys call
+    HUMAN_LIKE_TYPING = os.getenv('HUMAN_LIKE_TYPING', 'false').lower() == 'true'
     
-    # Role Matching Keywords
-    INTERNSHIP_KEYWORDS = [
+    # Role Matching Keywords (matched as substrings via github_monitor's
+    # precompiled _INTERNSHIP_KEYWORD_RE, so 'intern' also covers 'Interns')
+    INTERNSHIP_KEYWORDS = (
         'intern', 'internship', 'summer intern', 'co-op', 'coop',
         'student', 'new grad', 'entry level', 'software engineer intern',
         'data science intern', 'product manager intern'
-    ]
+    )
+    INTERNSHIP_KEYWORDS_LOWER = tuple(keyword.lower() for keyword in INTERNSHIP_KEYWORDS)
     
-    # Seattle Area Companies (to prioritize)
-    SEATTLE_COMPANIES = [
+    # Seattle Area Companies (to prioritize); a set, as it is only ever
+    # asked "is this company in it"
+    SEATTLE_COMPANIES = frozenset({
         'Amazon', 'Microsoft', 'Boeing', 'Expedia', 'Zillow',
         'Starbucks', 'Nintendo', 'T-Mobile', 'Alaska Airlines',
         'Costco', 'Nordstrom', 'REI', 'Weyerhaeuser'
-    ]
+    })
     
     # Database
     DATABASE_PATH = "output/internship_tracker.db"
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+SQLite connection helper for UW Internship Finder
+Opens the tracker database with the PRAGMAs every component should share
+"""
+
+import sqlite3
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open the tracker database tuned for many small write transactions"""
+    # Every component runs the same few statements repeatedly; keep more of
+    # them compiled than the default 128
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    # WAL lets readers (Excel export, summary) run while the monitor writes,
+    # and with synchronous=NORMAL a commit no longer waits on a full fsync
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # read pages via a 256 MB memory map
+    return conn
@@ -4,16 +4,80 @@ Excel Integration for UW Internship Finder
 Automatically updates live Excel spreadsheet with new opportunities
 """
 
-import sqlite3
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 from datetime import datetime
 import os
 import logging
 from config import Config
 from aws_monitor import EC2Monitor
+from database import connect
+
+# Styles shared by every sheet, built once instead of once per cell
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+BOLD_FONT = Font(bold=True)
+ITALIC_FONT = Font(italic=True)
+SECTION_FONT = Font(size=14, bold=True)
+LINK_FONT = Font(color="0000FF", underline="single")
+CENTERED = Alignment(horizontal="center")
+BLUE_HEADER_FILL = PatternFill(start_color="2F75B5", end_color="2F75B5", fill_type="solid")
+PURPLE_HEADER_FILL = PatternFill(start_color="4B0082", end_color="4B0082", fill_type="solid")  # Purple for UW
+ORANGE_HEADER_FILL = PatternFill(start_color="FF6600", end_color="FF6600", fill_type="solid")
+NEW_FILL = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
+WEEK_FILL = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+STOPPED_FILL = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
+
+
+def _styled_cell(ws, value, font=None, fill=None, alignment=None) -> Cell:
+    """Cell for a write-only sheet carrying the given styles"""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def _link_cell(ws, url, label):
+    """Clickable label for an http(s) URL; anything else is written as-is"""
+    if url and url.startswith('http'):
+        cell = _styled_cell(ws, label, font=LINK_FONT)
+        cell.hyperlink = url
+        return cell
+    return url
+
+
+def _set_column_widths(ws, rows, max_width: int):
+    """Size each column to its longest value, capped at max_width
+    Write-only sheets emit column widths ahead of the rows, so this has to run
+    before the first ws.append().
+    """
+    widths = {}
+    for row in rows:
+        for col, value in enumerate(row, 1):
+            if isinstance(value, Cell):
+                value = value.value
+            if value is not None:
+                widths[col] = max(widths.get(col, 0), len(str(value)))
+    for col, width in widths.items():
+        ws.column_dimensions[get_column_letter(col)].width = min(width + 2, max_width)
+
+
+def _set_column_widths_from_df(ws, df, max_width: int):
+    """Same sizing as _set_column_widths() for a sheet holding df under a
+    header of its column names, measured a whole column at a time
+    """
+    lengths = df.astype(str).apply(lambda column: column.str.len()).where(df.notna(), 0)
+    widths = np.maximum(df.columns.astype(str).str.len().to_numpy(), lengths.max().to_numpy()) + 2
+    for col, width in enumerate(np.minimum(widths, max_width), 1):
+        ws.column_dimensions[get_column_letter(col)].width = int(width)
 
 class ExcelIntegration:
     def __init__(self):
@@ -28,14 +92,10 @@ class ExcelIntegration:
             # Get data from database
             internships_df, alumni_df, opportunities_df = self._get_data_from_db()
             
-            # Create or load workbook
-            if os.path.exists(self.excel_file):
-                wb = load_workbook(self.excel_file)
-            else:
-                wb = Workbook()
-                # Remove default sheet
-                if 'Sheet' in wb.sheetnames:
-                    wb.remove(wb['Sheet'])
+            # Every sheet is rebuilt from the database, so nothing needs loading
+            # from the old file; write-only mode streams rows to disk instead of
+            # keeping a Cell object per value
+            wb = Workbook(write_only=True)
             
             # Create/update worksheets
             self._create_opportunities_sheet(wb, opportunities_df)
@@ -63,7 +123,7 @@ class ExcelIntegration:
     
     def _get_data_from_db(self):
         """Retrieve data from SQLite database"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
+        conn = connect(self.config.DATABASE_PATH)
         
         # Get internships
         internships_df = pd.read_sql_query('''
@@ -118,7 +178,7 @@ class ExcelIntegration:
                     ELSE 'Older'
                 END as "Status"
             FROM internships i
-            LEFT JOIN profiles p ON i.company = p.company
+            LEFT JOIN profiles p ON p.company = i.company COLLATE NOCASE
             ORDER BY i.discovered_date DESC, p.discovered_date DESC
         ''', conn)
         
@@ -127,170 +187,96 @@ class ExcelIntegration:
     
     def _create_opportunities_sheet(self, wb, df):
         """Create the main opportunities overview sheet"""
-        sheet_name = "🎯 Opportunities"
-        
-        if sheet_name in wb.sheetnames:
-            wb.remove(wb[sheet_name])
-        
-        ws = wb.create_sheet(sheet_name, 0)  # Make it first sheet
+        ws = wb.create_sheet("🎯 Opportunities", 0)  # Make it first sheet
         
         if df.empty:
-            ws['A1'] = "No opportunities found yet. The system will update this automatically!"
-            ws['A1'].font = Font(size=14, bold=True)
+            ws.append([_styled_cell(ws, "No opportunities found yet. The system will update this automatically!",
+                                    font=SECTION_FONT)])
             return
         
-        # Add headers
         headers = ["Company", "Internship Role", "Location", "Application Link", 
                   "UW Alumni Name", "Alumni Title", "Alumni LinkedIn", "Status"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="2F75B5", end_color="2F75B5", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center")
+        columns = ["company", "Internship Role", "Internship Location", "Application Link",
+                   "UW Alumni Name", "Alumni Title", "Alumni LinkedIn", "Status"]
+        df = df[columns]
         
-        # Add data
-        for row_idx, (_, row) in enumerate(df.iterrows(), 2):
-            ws.cell(row=row_idx, column=1, value=row.get('company', ''))
-            ws.cell(row=row_idx, column=2, value=row.get('Internship Role', ''))
-            ws.cell(row=row_idx, column=3, value=row.get('Internship Location', ''))
-            
-            # Make application link clickable
-            app_link = row.get('Application Link', '')
-            if app_link and app_link.startswith('http'):
-                ws.cell(row=row_idx, column=4).hyperlink = app_link
-                ws.cell(row=row_idx, column=4).value = "Apply Here"
-                ws.cell(row=row_idx, column=4).font = Font(color="0000FF", underline="single")
-            else:
-                ws.cell(row=row_idx, column=4, value=app_link)
-            
-            ws.cell(row=row_idx, column=5, value=row.get('UW Alumni Name', ''))
-            ws.cell(row=row_idx, column=6, value=row.get('Alumni Title', ''))
-            
-            # Make LinkedIn profile clickable
-            linkedin_url = row.get('Alumni LinkedIn', '')
-            if linkedin_url and linkedin_url.startswith('http'):
-                ws.cell(row=row_idx, column=7).hyperlink = linkedin_url
-                ws.cell(row=row_idx, column=7).value = "LinkedIn Profile"
-                ws.cell(row=row_idx, column=7).font = Font(color="0000FF", underline="single")
-            else:
-                ws.cell(row=row_idx, column=7, value=linkedin_url)
-            
+        # Auto-adjust column widths; link columns are sized by their label, not the URL
+        shown = df.set_axis(headers, axis=1)
+        for column, label in (("Application Link", "Apply Here"), ("Alumni LinkedIn", "LinkedIn Profile")):
+            shown[column] = shown[column].mask(shown[column].str.startswith('http', na=False), label)
+        _set_column_widths_from_df(ws, shown, 50)
+        
+        # Add headers
+        ws.append([_styled_cell(ws, header, font=HEADER_FONT, fill=BLUE_HEADER_FILL, alignment=CENTERED)
+                   for header in headers])
+        
+        # Add data; plain tuples in sheet column order rather than a Series per row
+        for (company, role, location, app_link, alumni_name, alumni_title,
+             linkedin_url, status) in df.itertuples(index=False, name=None):
             # Status with color coding
-            status = row.get('Status', '')
-            status_cell = ws.cell(row=row_idx, column=8, value=status)
             if status == 'NEW!':
-                status_cell.fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-                status_cell.font = Font(bold=True)
+                status = _styled_cell(ws, status, font=BOLD_FONT, fill=NEW_FILL)
             elif status == 'This Week':
-                status_cell.fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+                status = _styled_cell(ws, status, fill=WEEK_FILL)
+            
+            ws.append([
+                company,
+                role,
+                location,
+                # Make application link and LinkedIn profile clickable
+                _link_cell(ws, app_link, "Apply Here"),
+                alumni_name,
+                alumni_title,
+                _link_cell(ws, linkedin_url, "LinkedIn Profile"),
+                status,
+            ])
         
         # Add auto-filter
         ws.auto_filter.ref = f"A1:H{len(df) + 1}"
     
     def _create_internships_sheet(self, wb, df):
         """Create internships-only sheet"""
-        sheet_name = "Internships"
-        
-        if sheet_name in wb.sheetnames:
-            wb.remove(wb[sheet_name])
-        
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.create_sheet("Internships")
         
         if df.empty:
-            ws['A1'] = "No internships found yet."
+            ws.append(["No internships found yet."])
             return
         
-        # Convert dataframe to rows and add to worksheet
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
-        
-        # Format header row
-        for cell in ws[1]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="2F75B5", end_color="2F75B5", fill_type="solid")
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-        
-        # Add auto-filter
-        max_col_letter = ws.cell(row=1, column=ws.max_column).column_letter
-        ws.auto_filter.ref = f"A1:{max_col_letter}{ws.max_row}"
+        self._write_table(ws, df, BLUE_HEADER_FILL)
     
     def _create_alumni_sheet(self, wb, df):
         """Create UW alumni sheet"""
-        sheet_name = "UW Alumni"
-        
-        if sheet_name in wb.sheetnames:
-            wb.remove(wb[sheet_name])
-        
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.create_sheet("UW Alumni")
         
         if df.empty:
-            ws['A1'] = "No UW alumni found yet."
+            ws.append(["No UW alumni found yet."])
             return
         
-        # Convert dataframe to rows and add to worksheet
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
+        self._write_table(ws, df, PURPLE_HEADER_FILL)
+    
+    def _write_table(self, ws, df, header_fill):
+        """Write df to ws as a filterable table under a styled header row"""
+        # Auto-adjust column widths
+        _set_column_widths_from_df(ws, df, 50)
+        
+        rows = dataframe_to_rows(df, index=False, header=True)
         
         # Format header row
-        for cell in ws[1]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="4B0082", end_color="4B0082", fill_type="solid")  # Purple for UW
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        ws.append([_styled_cell(ws, header, font=HEADER_FONT, fill=header_fill) for header in next(rows)])
+        for row in rows:
+            ws.append(row)
         
         # Add auto-filter
-        max_col_letter = ws.cell(row=1, column=ws.max_column).column_letter
-        ws.auto_filter.ref = f"A1:{max_col_letter}{ws.max_row}"
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(df.columns))}{len(df) + 1}"
     
     def _create_aws_status_sheet(self, wb):
         """Create AWS EC2 status monitoring sheet"""
-        sheet_name = "☁️ AWS Status"
-        
-        if sheet_name in wb.sheetnames:
-            wb.remove(wb[sheet_name])
+        ws = wb.create_sheet("☁️ AWS Status")
         
-        ws = wb.create_sheet(sheet_name)
-        
-        # Title
-        ws['A1'] = "AWS EC2 Instance Status"
-        ws['A1'].font = Font(size=16, bold=True, color="FF6600")
-        ws.merge_cells('A1:G1')
+        # Title; rows are collected first because column widths depend on them
+        ws.merged_cells.add('A1:G1')
+        title_rows = [[_styled_cell(ws, "AWS EC2 Instance Status", font=Font(size=16, bold=True, color="FF6600"))], []]
+        rows = list(title_rows)
         
         # Get EC2 status
         try:
@@ -299,11 +285,10 @@ class ExcelIntegration:
             
             if 'error' in ec2_status:
                 # Show error information
-                ws['A3'] = "❌ Error connecting to AWS"
-                ws['A3'].font = Font(bold=True, color="FF0000")
-                ws['A4'] = ec2_status['error']
-                ws['A6'] = "To fix this issue:"
-                ws['A6'].font = Font(bold=True)
+                rows.append([_styled_cell(ws, "❌ Error connecting to AWS", font=Font(bold=True, color="FF0000"))])
+                rows.append([ec2_status['error']])
+                rows.append([])
+                rows.append([_styled_cell(ws, "To fix this issue:", font=BOLD_FONT)])
                 
                 instructions = [
                     "1. Install AWS CLI: pip install awscli",
@@ -315,161 +300,130 @@ class ExcelIntegration:
                     "   python3 src/aws_monitor.py"
                 ]
                 
-                for i, instruction in enumerate(instructions, 7):
-                    ws[f'A{i}'] = instruction
+                for instruction in instructions:
                     if instruction.startswith('   '):
-                        ws[f'A{i}'].font = Font(italic=True, color="666666")
+                        instruction = _styled_cell(ws, instruction, font=Font(italic=True, color="666666"))
+                    rows.append([instruction])
                 
-                return
-            
-            # Summary information
-            ws['A3'] = f"Last Checked: {ec2_status['timestamp']}"
-            ws['A3'].font = Font(italic=True)
-            
-            ws['A5'] = "Summary:"
-            ws['A5'].font = Font(bold=True)
-            
-            ws['A6'] = f"Total Regions Checked: {ec2_status['total_regions_checked']}"
-            ws['A7'] = f"Regions with Instances: {ec2_status['regions_with_instances']}"
-            ws['A8'] = f"Total Instances: {ec2_status['total_instances']}"
-            ws['A9'] = f"Running: {ec2_status['total_running']}"
-            ws['A9'].fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-            ws['A10'] = f"Stopped: {ec2_status['total_stopped']}"
-            if ec2_status['total_stopped'] > 0:
-                ws['A10'].fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-            
-            # Instance details header
-            current_row = 12
-            ws[f'A{current_row}'] = "Instance Details:"
-            ws[f'A{current_row}'].font = Font(bold=True)
-            current_row += 1
-            
-            # Headers for instance table
-            headers = ["Region", "Name", "Instance ID", "Type", "State", "Public IP", "Launch Time"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=current_row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="FF6600", end_color="FF6600", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-            
-            current_row += 1
-            
-            # Add instance data
-            for region_data in ec2_status.get('regions', []):
-                region_name = region_data['region']
-                for instance in region_data['instances']:
-                    ws.cell(row=current_row, column=1, value=region_name)
-                    ws.cell(row=current_row, column=2, value=instance['name'])
-                    ws.cell(row=current_row, column=3, value=instance['instance_id'])
-                    ws.cell(row=current_row, column=4, value=instance['instance_type'])
-                    
-                    # State with color coding
-                    state_cell = ws.cell(row=current_row, column=5, value=instance['state'])
-                    if instance['state'] == 'running':
-                        state_cell.fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-                        state_cell.font = Font(bold=True)
-                    elif instance['state'] == 'stopped':
-                        state_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-                    elif instance['state'] in ['pending', 'stopping', 'starting']:
-                        state_cell.fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-                    
-                    ws.cell(row=current_row, column=6, value=instance['public_ip'])
-                    ws.cell(row=current_row, column=7, value=instance['launch_time'])
+            else:
+                # Summary information
+                rows.append([_styled_cell(ws, f"Last Checked: {ec2_status['timestamp']}", font=ITALIC_FONT)])
+                rows.append([])
+                rows.append([_styled_cell(ws, "Summary:", font=BOLD_FONT)])
+                rows.append([f"Total Regions Checked: {ec2_status['total_regions_checked']}"])
+                rows.append([f"Regions with Instances: {ec2_status['regions_with_instances']}"])
+                rows.append([f"Total Instances: {ec2_status['total_instances']}"])
+                rows.append([_styled_cell(ws, f"Running: {ec2_status['total_running']}", fill=NEW_FILL)])
+                stopped = f"Stopped: {ec2_status['total_stopped']}"
+                if ec2_status['total_stopped'] > 0:
+                    stopped = _styled_cell(ws, stopped, fill=STOPPED_FILL)
+                rows.append([stopped])
+                
+                # Instance details header
+                rows.append([])
+                rows.append([_styled_cell(ws, "Instance Details:", font=BOLD_FONT)])
+                
+                # Headers for instance table
+                headers = ["Region", "Name", "Instance ID", "Type", "State", "Public IP", "Launch Time"]
+                rows.append([_styled_cell(ws, header, font=HEADER_FONT, fill=ORANGE_HEADER_FILL, alignment=CENTERED)
+                             for header in headers])
+                header_row = len(rows)
+                
+                # Add instance data
+                for region_data in ec2_status.get('regions', []):
+                    region_name = region_data['region']
+                    for instance in region_data['instances']:
+                        # State with color coding
+                        state = instance['state']
+                        if state == 'running':
+                            state = _styled_cell(ws, state, font=BOLD_FONT, fill=NEW_FILL)
+                        elif state == 'stopped':
+                            state = _styled_cell(ws, state, fill=STOPPED_FILL)
+                        elif state in ['pending', 'stopping', 'starting']:
+                            state = _styled_cell(ws, state, fill=WEEK_FILL)
+                        
+                        rows.append([region_name, instance['name'], instance['instance_id'],
+                                     instance['instance_type'], state, instance['public_ip'],
+                                     instance['launch_time']])
+                
+                # Auto-adjust column widths
+                _set_column_widths(ws, rows, 30)
+                
+                # Add auto-filter to instance table
+                if len(rows) > header_row:  # If we have instance data
+                    ws.auto_filter.ref = f"A{header_row}:G{len(rows)}"
+                
+                # Cost estimation section
+                if ec2_status['total_instances'] > 0:
+                    rows.append([])
+                    rows.append([])
+                    rows.append([_styled_cell(ws, "💰 Cost Estimates (30 days):", font=BOLD_FONT)])
                     
-                    current_row += 1
-            
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
                     try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
+                        cost_data = self.ec2_monitor.get_instance_costs()
+                        if 'error' not in cost_data:
+                            rows.append([_styled_cell(ws, f"Total Estimated: ${cost_data['total_estimated_cost']}",
+                                                      font=Font(bold=True, color="FF6600"))])
+                            rows.append([_styled_cell(ws, "(Estimates based on standard pricing - check AWS billing for actual costs)",
+                                                      font=Font(italic=True, size=10))])
                     except:
-                        pass
-                adjusted_width = min(max_length + 2, 30)
-                ws.column_dimensions[column_letter].width = adjusted_width
-            
-            # Add auto-filter to instance table
-            if current_row > 14:  # If we have instance data
-                ws.auto_filter.ref = f"A13:G{current_row-1}"
-            
-            # Cost estimation section
-            if ec2_status['total_instances'] > 0:
-                cost_row = current_row + 2
-                ws[f'A{cost_row}'] = "💰 Cost Estimates (30 days):"
-                ws[f'A{cost_row}'].font = Font(bold=True)
-                
-                try:
-                    cost_data = self.ec2_monitor.get_instance_costs()
-                    if 'error' not in cost_data:
-                        cost_row += 1
-                        ws[f'A{cost_row}'] = f"Total Estimated: ${cost_data['total_estimated_cost']}"
-                        ws[f'A{cost_row}'].font = Font(bold=True, color="FF6600")
-                        
-                        cost_row += 1
-                        ws[f'A{cost_row}'] = "(Estimates based on standard pricing - check AWS billing for actual costs)"
-                        ws[f'A{cost_row}'].font = Font(italic=True, size=10)
-                except:
-                    cost_row += 1
-                    ws[f'A{cost_row}'] = "Cost estimation unavailable"
+                        rows.append(["Cost estimation unavailable"])
             
         except Exception as e:
             self.logger.error(f"Error getting AWS status: {e}")
-            ws['A3'] = f"❌ Error retrieving AWS status: {str(e)}"
-            ws['A3'].font = Font(color="FF0000")
-            ws['A5'] = "Try running: python3 src/aws_monitor.py"
-            ws['A5'].font = Font(italic=True)
+            rows = title_rows + [
+                [_styled_cell(ws, f"❌ Error retrieving AWS status: {str(e)}", font=Font(color="FF0000"))],
+                [],
+                [_styled_cell(ws, "Try running: python3 src/aws_monitor.py", font=ITALIC_FONT)],
+            ]
+        
+        for row in rows:
+            ws.append(row)
     
     def _create_summary_sheet(self, wb, internships_df, alumni_df):
         """Create summary dashboard sheet"""
-        sheet_name = "Dashboard"
+        ws = wb.create_sheet("Dashboard")
         
-        if sheet_name in wb.sheetnames:
-            wb.remove(wb[sheet_name])
-        
-        ws = wb.create_sheet(sheet_name)
+        # Column widths
+        ws.column_dimensions['A'].width = 35
+        ws.column_dimensions['B'].width = 25
         
         # Title
-        ws['A1'] = "UW Internship Finder - Dashboard"
-        ws['A1'].font = Font(size=20, bold=True, color="2F75B5")
-        ws.merge_cells('A1:D1')
+        ws.merged_cells.add('A1:D1')
+        ws.append([_styled_cell(ws, "UW Internship Finder - Dashboard", font=Font(size=20, bold=True, color="2F75B5"))])
+        ws.append([])
         
         # Last updated
-        ws['A3'] = f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws['A3'].font = Font(italic=True)
+        ws.append([_styled_cell(ws, f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", font=ITALIC_FONT)])
+        ws.append([])
         
         # Statistics
-        ws['A5'] = "Summary Statistics"
-        ws['A5'].font = Font(size=14, bold=True)
+        ws.append([_styled_cell(ws, "Summary Statistics", font=SECTION_FONT)])
+        ws.append([])
         
-        ws['A7'] = "Total Internships Found:"
-        ws['B7'] = len(internships_df)
-        ws['B7'].font = Font(bold=True, size=12)
-        
-        ws['A8'] = "Total UW Alumni Found:"
-        ws['B8'] = len(alumni_df)
-        ws['B8'].font = Font(bold=True, size=12)
+        count_font = Font(bold=True, size=12)
+        ws.append(["Total Internships Found:", _styled_cell(ws, len(internships_df), font=count_font)])
+        ws.append(["Total UW Alumni Found:", _styled_cell(ws, len(alumni_df), font=count_font)])
+        ws.append([])
         
         # Recent activity
         if not internships_df.empty:
             new_internships = len(internships_df[internships_df['freshness'] == 'NEW!'])
             week_internships = len(internships_df[internships_df['freshness'] == 'This Week'])
             
-            ws['A10'] = "New Today:"
-            ws['B10'] = f"{new_internships} internships"
-            if new_internships > 0:
-                ws['B10'].fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-            
-            ws['A11'] = "This Week:"
-            ws['B11'] = f"{week_internships} internships"
-            if week_internships > 0:
-                ws['B11'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+            ws.append(["New Today:", _styled_cell(ws, f"{new_internships} internships",
+                                                  fill=NEW_FILL if new_internships > 0 else None)])
+            ws.append(["This Week:", _styled_cell(ws, f"{week_internships} internships",
+                                                  fill=WEEK_FILL if week_internships > 0 else None)])
+        else:
+            ws.append([])
+            ws.append([])
+        ws.append([])
+        ws.append([])
         
         # Instructions
-        ws['A14'] = "🎯 How to Use This Tracker"
-        ws['A14'].font = Font(size=14, bold=True)
+        ws.append([_styled_cell(ws, "🎯 How to Use This Tracker", font=SECTION_FONT)])
+        ws.append([])
         
         instructions = [
             "1. Check the 'Opportunities' tab for the best overview",
@@ -480,12 +434,8 @@ class ExcelIntegration:
             "6. This file updates automatically every 12 hours"
         ]
         
-        for i, instruction in enumerate(instructions, 16):
-            ws[f'A{i}'] = instruction
-        
-        # Auto-adjust column widths
-        ws.column_dimensions['A'].width = 35
-        ws.column_dimensions['B'].width = 25
+        for instruction in instructions:
+            ws.append([instruction])
     
     def _open_excel_if_possible(self):
         """Try to open Excel file automatically (macOS)"""
@@ -523,7 +473,7 @@ class ExcelIntegration:
                 
                 if notification_row == 25:
                     ws['A23'] = "🔔 Recent Alerts"
-                    ws['A23'].font = Font(size=14, bold=True)
+                    ws['A23'].font = SECTION_FONT
                 
                 ws[f'A{notification_row}'] = f"{datetime.now().strftime('%H:%M')} - {message}"
                 ws[f'A{notification_row}'].fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
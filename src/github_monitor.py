@@ -5,20 +5,65 @@ Monitors SimplifyJobs and speedyapply repos for new internship postings
 """
 
 import git
+import json
 import os
 import re
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 import logging
 from config import Config
+from database import connect
 from bs4 import BeautifulSoup
 
+# Compiled once at import; these run on every README table row
+_COMPANY_RE = re.compile(r'\*\*\[(.*?)\]')
+_APPLY_RE = re.compile(r'\[Apply\]\((.*?)\)')
+_STRONG_RE = re.compile(r'<strong>(.*?)</strong>')
+_HREF_RE = re.compile(r'href="([^"]*)"')
+# SimplifyJobs lines worth looking at: section headers and table rows
+_SIMPLIFY_LINE_RE = re.compile(r'^(?:##.*|\| (?:\*\*\[|↳).*)$', re.MULTILINE)
+# Headers and table rows are all either format parser looks at; matched on the
+# raw blob bytes so the rest of the README is never decoded
+_README_CANDIDATE_LINE_RE = re.compile(rb'^[#|].*$', re.MULTILINE)
+# New-file start line and length of a `git diff` hunk (length 1 when omitted)
+_DIFF_HUNK_RE = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+# Role/location filters compiled to single case-insensitive alternations, so
+# each field is scanned once and never copied with .lower()
+_INTERNSHIP_KEYWORD_RE = re.compile('|'.join(map(re.escape, Config.INTERNSHIP_KEYWORDS_LOWER)), re.IGNORECASE)
+_RELEVANT_LOCATION_RE = re.compile('|'.join(map(re.escape, dict.fromkeys(
+    Config.PREFERRED_LOCATIONS_LOWER + ('remote', 'united states')
+))), re.IGNORECASE)
+# Common patterns in internship repo commit messages. These are substring
+# matches on purpose ("Added ...", "Adding listings", "internships"), so a
+# whole-word set lookup would miss most real commit messages.
+_COMMIT_INDICATORS_RE = re.compile(r'add|new|update|intern|role|position|company|job|opening|hiring', re.IGNORECASE)
+
+# Retry policy for git network operations that GitHub throttles or drops
+_GIT_MAX_ATTEMPTS = 5
+_GIT_BACKOFF_BASE_SECONDS = 2
+_GIT_TRANSIENT_ERRORS = ('429', '500', '502', '503', 'rate limit', 'timed out', 'early eof',
+                         'could not resolve host', 'connection reset', 'unable to access')
+
+# Commits parsed on first clone; also the depth of the shallow clone
+_INITIAL_COMMIT_COUNT = 10
+
 class InternshipGitHubMonitor:
     def __init__(self):
         self.config = Config()
         self.repos_dir = "monitored_repos"
+        self.readme_shas_file = os.path.join(self.repos_dir, "readme_shas.json")
+        self.conn = None
+        # repo_name -> README parser, resolved once from the configured repo URLs
+        self._parsers = {
+            self._repo_name(repo_url): self._resolve_parser(repo_url)
+            for repo_url in self.config.GITHUB_REPOS
+        }
         self.setup_logging()
+        self._readme_shas = self._load_readme_shas()  # repo_name -> last parsed README blob sha
         self.setup_database()
         
     def setup_logging(self):
@@ -32,9 +77,31 @@ class InternshipGitHubMonitor:
         )
         self.logger = logging.getLogger(__name__)
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to the tracker database"""
+        return connect(self.config.DATABASE_PATH)
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the long-lived database connection, opening it on first use"""
+        if self.conn is None:
+            self.conn = self._connect()
+        return self.conn
+    
+    def close(self):
+        """Close the database connection; it is reopened on next use"""
+        if self.conn is not None:
+            # Refresh planner statistics after this run's writes (only analyzes
+            # tables that changed enough to matter)
+            self.conn.execute('PRAGMA optimize')
+            self.conn.close()
+            self.conn = None
+    
     def setup_database(self):
         """Setup SQLite database for tracking internships"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
+        conn = self._get_connection()
+        # sqlite3 does not open a transaction for DDL on its own, so without this
+        # every CREATE below would commit (and sync) separately
+        conn.execute('BEGIN')
         conn.execute('''
             CREATE TABLE IF NOT EXISTS internships (
                 id INTEGER PRIMARY KEY,
@@ -61,51 +128,191 @@ class InternshipGitHubMonitor:
                 UNIQUE(linkedin_url)
             )
         ''')
+        
+        # Recent-listing queries filter/sort on discovered_date (SQLite walks these
+        # backwards for ORDER BY ... DESC). Company matching is case-insensitive
+        # (export join, --company filters), so those
+        # indexes use COLLATE NOCASE and carry discovered_date to narrow by date.
+        # The UNIQUE constraints already index profiles.linkedin_url and lead with
+        # internships.company, so the summary's GROUP BY company streams that
+        # index as a covering scan without a separate company index
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_internships_discovered_date ON internships(discovered_date)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_profiles_discovered_date ON profiles(discovered_date)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_internships_company_date ON internships(company COLLATE NOCASE, discovered_date)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_profiles_company_date ON profiles(company COLLATE NOCASE, discovered_date)')
+        # Superseded by the company/date indexes above
+        for index in ('idx_internships_company_lower', 'idx_profiles_company_lower',
+                      'idx_internships_company_nocase', 'idx_profiles_company_nocase'):
+            conn.execute(f'DROP INDEX IF EXISTS {index}')
+        
+        # Row counts kept current by triggers so the summary reads them instead of
+        # scanning both tables; seeded from the real counts on first setup
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER
+            )
+        ''')
+        for table, key in (('internships', 'internship_count'), ('profiles', 'profile_count')):
+            conn.execute(f"INSERT OR IGNORE INTO meta (key, value) SELECT '{key}', COUNT(*) FROM {table}")
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_count_insert AFTER INSERT ON {table}
+                BEGIN UPDATE meta SET value = value + 1 WHERE key = '{key}'; END
+            ''')
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_count_delete AFTER DELETE ON {table}
+                BEGIN UPDATE meta SET value = value - 1 WHERE key = '{key}'; END
+            ''')
+        
+        # Per-company internship counts, kept the same way, so the summary's top
+        # companies are a short walk down idx_company_stats_n instead of a GROUP BY
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS company_stats (
+                company TEXT PRIMARY KEY,
+                n INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_company_stats_n ON company_stats(n)')
+        conn.execute('''
+            INSERT OR IGNORE INTO company_stats (company, n)
+            SELECT company, COUNT(*) FROM internships GROUP BY company
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_internships_stats_insert AFTER INSERT ON internships
+            BEGIN
+                INSERT INTO company_stats (company, n) VALUES (NEW.company, 1)
+                ON CONFLICT(company) DO UPDATE SET n = n + 1;
+            END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_internships_stats_delete AFTER DELETE ON internships
+            BEGIN
+                UPDATE company_stats SET n = n - 1 WHERE company = OLD.company;
+                DELETE FROM company_stats WHERE company = OLD.company AND n <= 0;
+            END
+        ''')
+        
+        # When each company's alumni were last searched, whether or not anyone
+        # was found, so the rescan window doesn't depend on profile dates (which
+        # are never refreshed); seeded from the profiles saved before this table
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS company_searches (
+                company TEXT COLLATE NOCASE PRIMARY KEY,
+                searched_at TEXT NOT NULL
+            )
+        ''')
+        conn.execute('''
+            INSERT OR IGNORE INTO company_searches (company, searched_at)
+            SELECT company, MAX(discovered_date) FROM profiles
+            WHERE company IS NOT NULL AND discovered_date IS NOT NULL
+            GROUP BY company COLLATE NOCASE
+        ''')
         conn.commit()
-        conn.close()
     
-    def clone_or_update_repos(self):
-        """Clone or update the monitored repositories"""
+    def _load_readme_shas(self) -> Dict[str, str]:
+        """Load the README blob sha last parsed for each repo"""
+        try:
+            with open(self.readme_shas_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Could not read {self.readme_shas_file}: {e}")
+            return {}
+    
+    def _save_readme_shas(self):
+        """Persist README blob shas so a restart doesn't re-parse unchanged READMEs"""
+        try:
+            with open(self.readme_shas_file, 'w') as f:
+                json.dump(self._readme_shas, f)
+        except Exception as e:
+            self.logger.warning(f"Could not write {self.readme_shas_file}: {e}")
+    
+    def _with_backoff(self, operation, description: str):
+        """Run a git network operation, retrying transient failures with exponential backoff"""
+        for attempt in range(1, _GIT_MAX_ATTEMPTS + 1):
+            try:
+                return operation()
+            except git.GitCommandError as e:
+                error_text = str(e).lower()
+                if attempt == _GIT_MAX_ATTEMPTS or not any(marker in error_text for marker in _GIT_TRANSIENT_ERRORS):
+                    raise
+                delay = _GIT_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+                self.logger.warning(f"{description} failed (attempt {attempt}/{_GIT_MAX_ATTEMPTS}), retrying in {delay}s")
+                time.sleep(delay)
+    
+    def _sync_repo(self, repo_url: str):
+        """Clone or pull one repository.
+        Returns (repo, old_commit, new_commit); old_commit is None for a fresh clone.
+        """
+        repo_name = self._repo_name(repo_url)
+        repo_path = os.path.join(self.repos_dir, repo_name)
+        
+        if os.path.exists(repo_path):
+            # Pull latest changes
+            repo = git.Repo(repo_path)
+            old_commit = repo.head.commit.hexsha
+            self._with_backoff(lambda: repo.remotes.origin.pull(ff_only=True), f"Pulling {repo_name}")
+            return repo, old_commit, repo.head.commit.hexsha
+        
+        # Shallow, single-branch clone: only the recent history we parse is
+        # fetched, not the full multi-hundred-MB history
+        self.logger.info(f"Cloning {repo_name}")
+        repo = self._with_backoff(
+            lambda: git.Repo.clone_from(repo_url, repo_path, depth=_INITIAL_COMMIT_COUNT, single_branch=True),
+            f"Cloning {repo_name}"
+        )
+        return repo, None, repo.head.commit.hexsha
+    
+    def clone_or_update_repos(self, on_new_companies: Optional[Callable[[List[str]], None]] = None):
+        """Clone or update the monitored repositories.
+        on_new_companies, if given, is called with each repo's companies as soon
+        as that repo is parsed, so callers can start follow-up work early.
+        """
         if not os.path.exists(self.repos_dir):
             os.makedirs(self.repos_dir)
         
         new_internships = []
         
-        for repo_url in self.config.GITHUB_REPOS:
-            repo_name = repo_url.split('/')[-1].replace('.git', '')
-            repo_path = os.path.join(self.repos_dir, repo_name)
+        # Network-bound clones/pulls run concurrently (git runs as a subprocess,
+        # so threads overlap fine); parsing below stays sequential
+        with ThreadPoolExecutor(max_workers=len(self.config.GITHUB_REPOS) or 1) as executor:
+            futures = {repo_url: executor.submit(self._sync_repo, repo_url) for repo_url in self.config.GITHUB_REPOS}
+        
+        for repo_url, future in futures.items():
+            repo_name = self._repo_name(repo_url)
             
             try:
-                if os.path.exists(repo_path):
-                    # Pull latest changes
-                    repo = git.Repo(repo_path)
-                    old_commit = repo.head.commit.hexsha
-                    repo.remotes.origin.pull()
-                    new_commit = repo.head.commit.hexsha
-                    
-                    if old_commit != new_commit:
-                        self.logger.info(f"New commits found in {repo_name}")
-                        # Get commits since last check
-                        commits = list(repo.iter_commits(f'{old_commit}..{new_commit}'))
-                        new_internships.extend(self.parse_new_commits(repo, commits, repo_name))
-                    else:
-                        self.logger.info(f"No new commits in {repo_name}")
-                else:
-                    # Clone repository
-                    self.logger.info(f"Cloning {repo_name}")
-                    repo = git.Repo.clone_from(repo_url, repo_path)
+                repo, old_commit, new_commit = future.result()
+                
+                repo_internships = []
+                if old_commit is None:
                     # Parse recent commits for initial setup
-                    recent_commits = list(repo.iter_commits(max_count=10))
-                    new_internships.extend(self.parse_new_commits(repo, recent_commits, repo_name))
+                    recent_commits = list(repo.iter_commits(max_count=_INITIAL_COMMIT_COUNT))
+                    repo_internships = self.parse_new_commits(repo, recent_commits, repo_name)
+                elif old_commit != new_commit:
+                    self.logger.info(f"New commits found in {repo_name}")
+                    # Only rows added to the README since last check can be new
+                    repo_internships = self.parse_readme_diff(repo, old_commit, new_commit, repo_name)
+                else:
+                    self.logger.info(f"No new commits in {repo_name}")
+                
+                new_internships.extend(repo_internships)
+                if repo_internships and on_new_companies:
+                    on_new_companies([internship['company'] for internship in repo_internships])
                     
             except Exception as e:
                 self.logger.error(f"Error with repository {repo_name}: {e}")
         
+        self._save_readme_shas()
         return new_internships
     
     def parse_new_commits(self, repo, commits, repo_name: str) -> List[Dict]:
         """Parse commits for new internship postings"""
         new_internships = []
+        # Commits run newest first; the newest README parsed is what gets persisted
+        last_sha = self._readme_shas.get(repo_name)
+        newest_sha = None
         
         for commit in commits:
             # Check if commit message suggests new internship
@@ -115,11 +322,20 @@ class InternshipGitHubMonitor:
                 # Parse the README or main files for new entries
                 try:
                     # Get the README content from this commit
-                    readme_content = ""
-                    for item in commit.tree.traverse():
-                        if item.name.lower() == 'readme.md':
-                            readme_content = item.data_stream.read().decode('utf-8')
-                            break
+                    readme_blob = self._get_readme_blob(commit)
+                    if readme_blob is None:
+                        continue
+                    
+                    # Commits that didn't change the README yield nothing new
+                    if readme_blob.hexsha == last_sha:
+                        self.logger.debug(f"README unchanged in {commit.hexsha[:8]}, skipping")
+                        continue
+                    last_sha = readme_blob.hexsha
+                    if newest_sha is None:
+                        newest_sha = readme_blob.hexsha
+                    
+                    readme_bytes = readme_blob.data_stream.read()
+                    readme_content = b'\n'.join(_README_CANDIDATE_LINE_RE.findall(readme_bytes)).decode('utf-8', errors='replace')
                     
                     if readme_content:
                         internships = self.parse_readme_for_internships(readme_content, repo_name, commit.hexsha)
@@ -128,93 +344,178 @@ class InternshipGitHubMonitor:
                 except Exception as e:
                     self.logger.error(f"Error parsing commit {commit.hexsha}: {e}")
         
+        if newest_sha is not None:
+            self._readme_shas[repo_name] = newest_sha
         return new_internships
     
+    def parse_readme_diff(self, repo, old_commit: str, new_commit: str, repo_name: str) -> List[Dict]:
+        """Parse only the README lines added between two commits
+        Each hunk is preceded by the new README's section headers above it, so
+        rows get the same section a full parse would give them.
+        """
+        # Skip the diff when new_commit's README is the one last parsed (e.g.
+        # before a restart)
+        readme_blob = self._get_readme_blob(repo.commit(new_commit))
+        if readme_blob is not None and readme_blob.hexsha == self._readme_shas.get(repo_name):
+            self.logger.info(f"README already parsed for {repo_name}, skipping")
+            return []
+        
+        try:
+            diff_text = repo.git.diff(f'{old_commit}..{new_commit}', '--', 'README.md', unified=0)
+        except Exception as e:
+            self.logger.error(f"Error diffing README in {repo_name}: {e}")
+            return []
+        
+        if not diff_text:
+            self.logger.info(f"README unchanged in {repo_name}")
+            if readme_blob is not None:
+                self._readme_shas[repo_name] = readme_blob.hexsha
+            return []
+        
+        # Keep added lines (minus the '+' marker); both table parsers filter line
+        # by line. -U0 hunks carry no context, so the "##" headers above each
+        # hunk are replayed from the new README ahead of its lines (headers
+        # added inside a hunk are already among them)
+        headers = self._readme_headers(readme_blob)
+        next_header = 0
+        lines = []
+        added_count = 0
+        for line in diff_text.split('\n'):
+            hunk = _DIFF_HUNK_RE.match(line)
+            if hunk:
+                start = int(hunk.group(1))
+                end = start + int(hunk.group(2) or 1)
+                while next_header < len(headers) and headers[next_header][0] < end:
+                    if headers[next_header][0] < start:
+                        lines.append(headers[next_header][1])
+                    next_header += 1
+            elif line.startswith('+') and not line.startswith('+++'):
+                lines.append(line[1:])
+                added_count += 1
+        self.logger.info(f"{added_count} README lines added in {repo_name}")
+        
+        internships = self.parse_readme_for_internships('\n'.join(lines), repo_name, new_commit)
+        if readme_blob is not None:
+            self._readme_shas[repo_name] = readme_blob.hexsha
+        return internships
+    
+    @staticmethod
+    def _readme_headers(readme_blob) -> List[Tuple[int, str]]:
+        """(line number, text) of each "##" header in a README blob"""
+        if readme_blob is None:
+            return []
+        return [
+            (number, line.decode('utf-8', errors='replace'))
+            for number, line in enumerate(readme_blob.data_stream.read().split(b'\n'), 1)
+            if line.startswith(b'##')
+        ]
+    
+    def _get_readme_blob(self, commit):
+        """Look up the top-level README blob of a commit without walking the tree"""
+        try:
+            return commit.tree / 'README.md'
+        except KeyError:
+            # Fall back to a case-insensitive match among top-level files
+            for blob in commit.tree.blobs:
+                if blob.name.lower() == 'readme.md':
+                    return blob
+        return None
+    
     def is_internship_commit(self, commit_message: str) -> bool:
         """Check if commit message indicates new internship posting"""
-        message_lower = commit_message.lower()
+        return _COMMIT_INDICATORS_RE.search(commit_message) is not None
+    
+    @staticmethod
+    def _repo_name(repo_url: str) -> str:
+        """Local directory / display name for a repository URL"""
+        return repo_url.split('/')[-1].replace('.git', '')
+    
+    def _resolve_parser(self, repo: str):
+        """Pick the README parser for a repo URL or name, or None if unsupported"""
+        # For SimplifyJobs format: | Company | Role | Location | Application | Age |
+        if "SimplifyJobs" in repo or "Summer2026" in repo:
+            return self._parse_simplify_jobs_format
         
-        # Common patterns in internship repo commits
-        internship_indicators = [
-            'add', 'new', 'update', 'intern', 'role', 'position', 
-            'company', 'job', 'opening', 'hiring'
-        ]
+        # For speedyapply format (may be different)
+        if "speedyapply" in repo or "2026-SWE" in repo:
+            return self._parse_speedyapply_format
         
-        return any(indicator in message_lower for indicator in internship_indicators)
+        return None
     
     def parse_readme_for_internships(self, content: str, repo_name: str, commit_hash: str) -> List[Dict]:
         """Parse README content for internship listings"""
-        internships = []
-        
-        # For SimplifyJobs format: | Company | Role | Location | Application | Age |
-        if "SimplifyJobs" in repo_name or "Summer2026" in repo_name:
-            internships.extend(self._parse_simplify_jobs_format(content, repo_name, commit_hash))
-        
-        # For speedyapply format (may be different)
-        elif "speedyapply" in repo_name or "2026-SWE" in repo_name:
-            internships.extend(self._parse_speedyapply_format(content, repo_name, commit_hash))
+        if repo_name not in self._parsers:
+            # Names outside GITHUB_REPOS (e.g. from the helper scripts) resolve once
+            self._parsers[repo_name] = self._resolve_parser(repo_name)
+        parser = self._parsers[repo_name]
+        if parser is None:
+            return []
         
-        return internships
+        # Unchanged READMEs never get here: both callers skip a README blob
+        # already parsed (see _readme_shas)
+        return parser(content, repo_name, commit_hash)
     
     def _parse_simplify_jobs_format(self, content: str, repo_name: str, commit_hash: str) -> List[Dict]:
         """Parse SimplifyJobs markdown table format"""
         internships = []
         
-        # Look for markdown table rows
-        lines = content.split('\n')
+        # Only section headers and table rows are pulled out of the README;
+        # prose, badges and separators never reach the Python loop
         current_section = ""
+        discovered_date = datetime.now().isoformat()
         
-        for line in lines:
+        for line in _SIMPLIFY_LINE_RE.findall(content):
             # Track current section
-            if line.startswith('##') and any(keyword in line.lower() for keyword in ['software', 'data', 'engineer']):
-                current_section = line.strip()
+            if line.startswith('##'):
+                if any(keyword in line.lower() for keyword in ['software', 'data', 'engineer']):
+                    current_section = line.strip()
                 continue
             
             # Parse table rows (format: | Company | Role | Location | Application | Age |)
-            if line.startswith('| **[') or line.startswith('| ↳'):
-                try:
-                    internship = self._parse_table_row(line, repo_name, commit_hash, current_section)
-                    if internship and self._is_relevant_internship(internship):
-                        internships.append(internship)
-                except Exception as e:
-                    self.logger.debug(f"Error parsing line: {line[:50]}... - {e}")
+            try:
+                internship = self._parse_table_row(line, repo_name, commit_hash, current_section, discovered_date)
+                if internship and self._is_relevant_internship(internship):
+                    internships.append(internship)
+            except Exception as e:
+                self.logger.debug(f"Error parsing line: {line[:50]}... - {e}")
         
         return internships
     
-    def _parse_table_row(self, line: str, repo_name: str, commit_hash: str, section: str) -> Optional[Dict]:
+    def _parse_table_row(self, line: str, repo_name: str, commit_hash: str, section: str,
+                         discovered_date: Optional[str] = None) -> Optional[Dict]:
         """Parse a single table row"""
-        # Split by | and clean up
-        parts = [part.strip() for part in line.split('|')]
+        # Only the first four cells are used, so leave the rest of the row unsplit
+        parts = line.split('|', 5)
         
         if len(parts) < 5:
             return None
         
-        company_part = parts[1]
-        role_part = parts[2]
-        location_part = parts[3]
+        company_part = parts[1].strip()
+        role_part = parts[2].strip()
+        location_part = parts[3].strip()
         application_part = parts[4]
         
-        # Extract company name
-        company_match = re.search(r'\*\*\[(.*?)\]', company_part)
-        company = company_match.group(1) if company_match else company_part.strip()
-        
         # Handle continuation rows (↳)
-        if company_part.strip() == '↳':
+        if company_part == '↳':
             company = "Previous Company"  # Will need context from previous row
+        else:
+            # Extract company name
+            company_match = _COMPANY_RE.search(company_part)
+            company = company_match.group(1) if company_match else company_part
         
         # Extract application link
-        app_link_match = re.search(r'\[Apply\]\((.*?)\)', application_part)
+        app_link_match = _APPLY_RE.search(application_part)
         app_link = app_link_match.group(1) if app_link_match else ""
         
         return {
             'company': company,
-            'role': role_part.strip(),
-            'location': location_part.strip(),
+            'role': role_part,
+            'location': location_part,
             'application_link': app_link,
             'source_repo': repo_name,
             'commit_hash': commit_hash,
             'section': section,
-            'discovered_date': datetime.now().isoformat()
+            'discovered_date': discovered_date or datetime.now().isoformat()
         }
     
     def _parse_speedyapply_format(self, content: str, repo_name: str, commit_hash: str) -> List[Dict]:
@@ -287,10 +588,10 @@ class InternshipGitHubMonitor:
             }
         except Exception:
             # Fallback to the previous regex-based approach
-            company_match = re.search(r'<strong>(.*?)</strong>', company_part)
+            company_match = _STRONG_RE.search(company_part)
             company = company_match.group(1) if company_match else company_part.strip()
 
-            app_link_match = re.search(r'href="([^"]*)"', posting_part)
+            app_link_match = _HREF_RE.search(posting_part)
             application_link = app_link_match.group(1) if app_link_match else ""
 
             position = position_part.strip()
@@ -312,71 +613,74 @@ class InternshipGitHubMonitor:
     
     def _is_relevant_internship(self, internship: Dict) -> bool:
         """Check if internship is relevant based on location and role"""
-        role_lower = internship['role'].lower()
-        location_lower = internship['location'].lower()
-        
         # Check if it's an internship
-        if not any(keyword in role_lower for keyword in self.config.INTERNSHIP_KEYWORDS):
+        if not _INTERNSHIP_KEYWORD_RE.search(internship['role']):
             return False
         
-        # Prioritize Seattle area and US positions
-        if any(loc.lower() in location_lower for loc in self.config.PREFERRED_LOCATIONS):
-            return True
-        
-        # Also include remote and general US positions
-        if 'remote' in location_lower or 'united states' in location_lower:
-            return True
-        
-        return False
+        # Seattle area, remote and general US positions
+        return _RELEVANT_LOCATION_RE.search(internship['location']) is not None
+    
+    def _dedupe_internships(self, internships: List[Dict]) -> List[Dict]:
+        """Drop rows repeated across parsed README versions, keeping the first"""
+        # Keyed like the table's UNIQUE(company, role, application_link) constraint
+        unique = {}
+        for internship in internships:
+            unique.setdefault((internship['company'], internship['role'], internship['application_link']), internship)
+        return list(unique.values())
     
-    def save_internships(self, internships: List[Dict]):
-        """Save new internships to database"""
+    def save_internships(self, internships: List[Dict]) -> int:
+        """Save new internships to database, returning the number of rows inserted"""
         if not internships:
-            return
+            return 0
+        
+        rows = [
+            (
+                internship['company'],
+                internship['role'],
+                internship['location'],
+                internship['application_link'],
+                internship['source_repo'],
+                internship['discovered_date'],
+                internship['commit_hash']
+            )
+            for internship in internships
+        ]
         
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
+        conn = self._get_connection()
         
-        for internship in internships:
-            try:
-                conn.execute('''
-                    INSERT OR IGNORE INTO internships 
-                    (company, role, location, application_link, source_repo, discovered_date, commit_hash)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    internship['company'],
-                    internship['role'],
-                    internship['location'],
-                    internship['application_link'],
-                    internship['source_repo'],
-                    internship['discovered_date'],
-                    internship['commit_hash']
-                ))
-                self.logger.info(f"Saved new internship: {internship['company']} - {internship['role']}")
-                
-            except sqlite3.IntegrityError:
-                # Already exists
-                pass
+        # One prepared statement and one transaction for the whole batch;
+        # INSERT OR IGNORE already skips rows that violate the UNIQUE constraint
+        with conn:
+            cursor = conn.executemany('''
+                INSERT OR IGNORE INTO internships 
+                (company, role, location, application_link, source_repo, discovered_date, commit_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            saved_count = cursor.rowcount
         
-        conn.commit()
-        conn.close()
+        self.logger.info(f"Saved {saved_count} new internships ({len(rows) - saved_count} already known)")
+        return saved_count
     
     def get_companies_with_new_internships(self) -> List[str]:
-        """Get list of companies that have new internships"""
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
-        cursor = conn.execute('''
+        """Get list of companies that have new internships
+        
+        run_monitor() returns companies straight from the rows it parsed; this
+        query serves callers without that in-memory result (e.g. `enqueue`)
+        and is backed by idx_internships_discovered_date.
+        """
+        cursor = self._get_connection().execute('''
             SELECT DISTINCT company FROM internships 
             WHERE discovered_date > datetime('now', '-1 day')
         ''')
         companies = [row[0] for row in cursor.fetchall()]
-        conn.close()
         return companies
     
-    def run_monitor(self):
+    def run_monitor(self, on_new_companies: Optional[Callable[[List[str]], None]] = None):
         """Main monitoring function"""
         self.logger.info("Starting GitHub repository monitoring")
         
         try:
-            new_internships = self.clone_or_update_repos()
+            new_internships = self._dedupe_internships(self.clone_or_update_repos(on_new_companies))
             
             if new_internships:
                 self.logger.info(f"Found {len(new_internships)} new internships")
@@ -399,6 +703,9 @@ class InternshipGitHubMonitor:
         except Exception as e:
             self.logger.error(f"Error in monitoring: {e}")
             return []
+        
+        finally:
+            self.close()
 
 if __name__ == "__main__":
     monitor = InternshipGitHubMonitor()
@@ -13,6 +13,9 @@ import tempfile
 import shutil
 import pickle
 import json
+import threading
+import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -22,8 +25,46 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
 from config import Config
+from database import connect
 from bs4 import BeautifulSoup
 
+# Search result card selectors, most specific first
+SEARCH_RESULT_SELECTORS = [
+    ".entity-result__item",
+    ".reusable-search__result-container",
+    "[data-chameleon-result-urn]",
+    ".search-result__wrapper",
+    ".search-results-container .search-result",
+    ".search-result",
+    ".entity-result"
+]
+
+# Any of these means the search page has finished rendering
+SEARCH_PAGE_READY_SELECTOR = ", ".join(SEARCH_RESULT_SELECTORS + [".search-no-results__container"])
+
+# Resources the headless scraper never needs to download
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm'
+]
+
+class _RequestRateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads sharing it"""
+    
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+    
+    def wait(self):
+        """Block until this caller's slot comes up"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 class UWLinkedInScraper:
     def __init__(self):
         self.config = Config()
@@ -31,6 +72,10 @@ class UWLinkedInScraper:
         self.wait = None
         self.temp_user_data_dir = None
         self.session_file = "linkedin_session.pkl"
+        self.conn = None
+        self.api_session = None
+        self.api_rate_limiter = _RequestRateLimiter(self.config.LINKEDIN_API_REQUESTS_PER_SECOND)
+        self.logged_in = False
         self.setup_logging()
         
     def setup_logging(self):
@@ -71,12 +116,15 @@ class UWLinkedInScraper:
             headless = os.path.exists(self.session_file)
         
         if headless:
-            options.add_argument('--headless')  # Run without GUI
+            options.add_argument('--headless=new')  # Run without GUI
+            # Nobody looks at the page, so skip downloading and painting images
+            options.add_argument('--blink-settings=imagesEnabled=false')
             self.logger.info("Running in headless mode")
         else:
             self.logger.info("Running with GUI for manual verification")
         
         options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
         options.add_argument(f'--user-data-dir={self.temp_user_data_dir}')  # Unique user data directory
         options.add_argument(f'--remote-debugging-port={debug_port}')
         options.add_argument('--disable-web-security')
@@ -88,6 +136,8 @@ class UWLinkedInScraper:
         try:
             self.driver = webdriver.Chrome(options=options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            if headless:
+                self._block_heavy_resources()
             self.wait = WebDriverWait(self.driver, 10)
             self.logger.info(f"Chrome driver initialized with user data dir: {self.temp_user_data_dir}")
         except Exception as e:
@@ -95,6 +145,16 @@ class UWLinkedInScraper:
             self.cleanup_temp_dir()
             raise
     
+    def _block_heavy_resources(self):
+        """Block image, font and media requests; the parsers only read the DOM text.
+        Stylesheets are left alone since element.text depends on rendered visibility.
+        """
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+        except Exception as e:
+            self.logger.debug(f"Could not enable resource blocking: {e}")
+    
     def save_session(self):
         """Save LinkedIn session cookies to file"""
         try:
@@ -161,11 +221,11 @@ class UWLinkedInScraper:
             
             # Enter email
             email_field = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
-            self._type_slowly(email_field, self.config.LINKEDIN_EMAIL)
+            self._type_text(email_field, self.config.LINKEDIN_EMAIL)
             
             # Enter password
             password_field = self.driver.find_element(By.ID, "password")
-            self._type_slowly(password_field, self.config.LINKEDIN_PASSWORD)
+            self._type_text(password_field, self.config.LINKEDIN_PASSWORD)
             
             # Click login
             login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
@@ -215,8 +275,8 @@ class UWLinkedInScraper:
             self.logger.debug(f"Search URL: {search_url}")
             self.driver.get(search_url)
             
-            # Wait for page to load
-            time.sleep(5)
+            # Wait for results (or the empty state) instead of a fixed sleep
+            self._wait_for_results()
             
             # Debug: Log page title and URL
             self.logger.debug(f"Page title: {self.driver.title}")
@@ -255,6 +315,123 @@ class UWLinkedInScraper:
             self.logger.error(f"Error searching for {company_name}: {e}")
             return []
     
+    def _build_api_session(self) -> Optional[requests.Session]:
+        """Reuse the logged-in browser's cookies for plain HTTP search requests"""
+        try:
+            cookies = self.driver.get_cookies()
+            cookie_values = {cookie['name']: cookie['value'] for cookie in cookies}
+            
+            # LinkedIn expects the JSESSIONID value (without quotes) as the CSRF token
+            jsessionid = cookie_values.get('JSESSIONID')
+            if not cookie_values.get('li_at') or not jsessionid:
+                self.logger.warning("Session cookies missing - using browser search")
+                return None
+            
+            session = requests.Session()
+            for cookie in cookies:
+                session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+            
+            session.headers.update({
+                'csrf-token': jsessionid.strip('"'),
+                'x-restli-protocol-version': '2.0.0',
+                'accept': 'application/vnd.linkedin.normalized+json+2.1',
+                'user-agent': self.driver.execute_script("return navigator.userAgent")
+            })
+            self.logger.info("Using LinkedIn HTTP search with browser session cookies")
+            return session
+        except Exception as e:
+            self.logger.warning(f"Could not build HTTP session - using browser search: {e}")
+            return None
+    
+    def search_uw_alumni_via_api(self, company_name: str) -> Optional[List[Dict]]:
+        """Search for UW alumni over HTTP without rendering pages.
+        Returns None if the request fails, so the caller can fall back to the browser.
+        """
+        search_query = f'school:"University of Washington" AND company:"{company_name}"'
+        page_size = 10
+        max_pages = min(self.config.MAX_PAGES_PER_SEARCH, 3)  # Same limit as browser search
+        profiles = []
+        
+        for page in range(max_pages):
+            try:
+                # Concurrent company searches share one request budget
+                self.api_rate_limiter.wait()
+                response = self.api_session.get(
+                    "https://www.linkedin.com/voyager/api/search/blended",
+                    params={
+                        'keywords': search_query,
+                        'origin': 'GLOBAL_SEARCH_HEADER',
+                        'q': 'all',
+                        'filters': 'List(resultType->PEOPLE)',
+                        'start': page * page_size,
+                        'count': page_size
+                    },
+                    timeout=15
+                )
+                response.raise_for_status()
+                data = json.loads(response.content)
+            except Exception as e:
+                self.logger.warning(f"HTTP search failed for {company_name} - falling back to browser: {e}")
+                return None
+            
+            page_profiles = self._parse_api_results(data, company_name)
+            profiles.extend(page_profiles)
+            
+            if not page_profiles or len(profiles) >= self.config.MAX_PROFILES_PER_COMPANY:
+                break
+            
+            # Random delay between pages
+            time.sleep(random.uniform(3, 6))
+        
+        self.logger.info(f"Found {len(profiles)} UW alumni at {company_name}")
+        return profiles[:self.config.MAX_PROFILES_PER_COMPANY]
+    
+    def _search_companies_via_api(self, company_names: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Run the HTTP searches for several companies at once over the shared session.
+        Companies whose search failed map to None so they can be retried in the browser.
+        """
+        def search(company_name: str) -> Optional[List[Dict]]:
+            self.logger.info(f"Searching UW alumni at {company_name} over HTTP")
+            try:
+                return self.search_uw_alumni_via_api(company_name)
+            except Exception as e:
+                self.logger.warning(f"HTTP search failed for {company_name} - falling back to browser: {e}")
+                return None
+        
+        workers = max(1, min(self.config.LINKEDIN_API_CONCURRENCY, len(company_names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(company_names, executor.map(search, company_names)))
+    
+    def _parse_api_results(self, data: Dict, company_name: str) -> List[Dict]:
+        """Turn a blended search response into profile dicts"""
+        profiles = []
+        
+        for cluster in (data.get('data') or data).get('elements', []):
+            for element in cluster.get('elements', []):
+                name = (element.get('title') or {}).get('text', '').strip()
+                linkedin_url = (element.get('navigationUrl') or '').split('?')[0]
+                title = (element.get('headline') or {}).get('text', '').strip()
+                location = (element.get('subline') or {}).get('text', '').strip()
+                snippet = (element.get('snippetText') or {}).get('text', '')
+                
+                if not name or '/in/' not in linkedin_url:
+                    continue
+                
+                if not self._verify_uw_connection_text(f"{title} {location} {snippet}".lower()):
+                    continue
+                
+                profiles.append({
+                    'name': name,
+                    'title': title or "Not specified",
+                    'company': company_name,
+                    'linkedin_url': linkedin_url,
+                    'location': location,
+                    'college_match': 1,
+                    'discovered_date': time.strftime('%Y-%m-%d %H:%M:%S')
+                })
+        
+        return profiles
+    
     def _extract_profiles_from_page(self, company_name: str) -> List[Dict]:
         """Extract profile data from current search results page"""
         profiles = []
@@ -268,18 +445,8 @@ class UWLinkedInScraper:
             self.logger.debug(f"Page source snippet: {page_source_snippet}")
             
             # Try multiple approaches to find search results
-            search_result_selectors = [
-                ".entity-result__item",
-                ".reusable-search__result-container",
-                "[data-chameleon-result-urn]",
-                ".search-result__wrapper",
-                ".search-results-container .search-result",
-                ".search-result",
-                ".entity-result"
-            ]
-            
             search_results = []
-            for selector in search_result_selectors:
+            for selector in SEARCH_RESULT_SELECTORS:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
@@ -544,6 +711,15 @@ class UWLinkedInScraper:
         except Exception:
             return True
     
+    def _wait_for_results(self) -> bool:
+        """Wait until the search page shows results or its empty state"""
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SEARCH_PAGE_READY_SELECTOR)))
+            return True
+        except TimeoutException:
+            self.logger.debug("Timed out waiting for search results to render")
+            return False
+    
     def _go_to_next_page(self) -> bool:
         """Navigate to next page of search results"""
         try:
@@ -551,8 +727,15 @@ class UWLinkedInScraper:
             next_button = self.driver.find_element(By.XPATH, "//button[@aria-label='Next']")
             
             if next_button.is_enabled():
+                # Remember a current result so we can tell when it's been replaced
+                current_results = self.driver.find_elements(By.CSS_SELECTOR, SEARCH_PAGE_READY_SELECTOR)
                 self.driver.execute_script("arguments[0].click();", next_button)
-                time.sleep(3)
+                if current_results:
+                    try:
+                        self.wait.until(EC.staleness_of(current_results[0]))
+                    except TimeoutException:
+                        self.logger.debug("Previous results still attached after clicking next")
+                self._wait_for_results()
                 return True
             else:
                 return False
@@ -564,43 +747,78 @@ class UWLinkedInScraper:
             self.logger.debug(f"Error navigating to next page: {e}")
             return False
     
-    def _type_slowly(self, element, text: str):
-        """Type text slowly to mimic human behavior"""
+    def _type_text(self, element, text: str):
+        """Fill a form field, typing slowly only when HUMAN_LIKE_TYPING is enabled"""
+        if self.config.HUMAN_LIKE_TYPING:
+            self._type_slowly(element, text)
+            return
+        
+        # One send_keys call is a single WebDriver round trip for the whole string
+        element.clear()
+        element.send_keys(text)
+    
+    def _type_slowly(self, element, text: str, chunk_size: int = 2):
+        """Type text in small chunks with pauses to mimic human behavior"""
         element.clear()
-        for char in text:
-            element.send_keys(char)
+        for i in range(0, len(text), chunk_size):
+            element.send_keys(text[i:i + chunk_size])
             time.sleep(random.uniform(0.05, 0.15))
     
-    def save_profiles(self, profiles: List[Dict]):
-        """Save profiles to database"""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to the tracker database"""
+        return connect(self.config.DATABASE_PATH)
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the long-lived database connection, opening it on first use"""
+        if self.conn is None:
+            self.conn = self._connect()
+        return self.conn
+    
+    def save_profiles(self, profiles: List[Dict]) -> int:
+        """Save profiles to database, returning the number of rows inserted or updated"""
         if not profiles:
-            return
+            return 0
         
-        conn = sqlite3.connect(self.config.DATABASE_PATH)
+        rows = [
+            (
+                profile['name'],
+                profile['title'],
+                profile['company'],
+                profile['linkedin_url'],
+                profile['college_match'],
+                profile['discovered_date']
+            )
+            for profile in profiles
+        ]
         
-        for profile in profiles:
-            try:
-                conn.execute('''
-                    INSERT OR IGNORE INTO profiles 
-                    (name, title, company, linkedin_url, college_match, discovered_date)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    profile['name'],
-                    profile['title'],
-                    profile['company'],
-                    profile['linkedin_url'],
-                    profile['college_match'],
-                    profile['discovered_date']
-                ))
-                
-            except sqlite3.IntegrityError:
-                # Profile already exists
-                pass
+        conn = self._get_connection()
         
-        conn.commit()
-        conn.close()
+        # Single transaction; known profiles are only rewritten when the person's
+        # title or company changed, so unchanged rows cost no WAL writes
+        with conn:
+            cursor = conn.executemany('''
+                INSERT INTO profiles 
+                (name, title, company, linkedin_url, college_match, discovered_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(linkedin_url) DO UPDATE SET
+                    name = excluded.name,
+                    title = excluded.title,
+                    company = excluded.company
+                WHERE title IS NOT excluded.title OR company IS NOT excluded.company
+            ''', rows)
+            saved_count = cursor.rowcount
         
-        self.logger.info(f"Saved {len(profiles)} profiles to database")
+        self.logger.info(f"Saved {saved_count} new or updated profiles to database ({len(rows) - saved_count} unchanged)")
+        return saved_count
+    
+    def record_company_search(self, company: str):
+        """Note that company's alumni were just searched, even if none were found"""
+        conn = self._get_connection()
+        with conn:
+            conn.execute('''
+                INSERT INTO company_searches (company, searched_at) VALUES (?, ?)
+                ON CONFLICT(company) DO UPDATE SET searched_at = excluded.searched_at
+            ''', (company, time.strftime('%Y-%m-%d %H:%M:%S')))
     
     def scrape_companies(self, company_names: List[str]):
         """Scrape UW alumni from multiple companies"""
@@ -608,20 +826,59 @@ class UWLinkedInScraper:
             self.logger.info("No companies to scrape")
             return
         
+        workers = min(self.config.LINKEDIN_WORKERS, len(company_names))
+        if workers > 1:
+            all_profiles = self._scrape_in_parallel(company_names, workers)
+        else:
+            all_profiles = self._scrape_batch(company_names)
+        if all_profiles is None:
+            return
+        
+        if all_profiles:
+            print(f"\nTotal: Found {len(all_profiles)} UW alumni across all companies!")
+        else:
+            print("No UW alumni found at any of the target companies.")
+    
+    def start_session(self) -> bool:
+        """Open the browser and log in, unless a session is already open.
+        Safe to call ahead of scraping (e.g. from a background thread) so the
+        slow browser start-up overlaps other work.
+        """
+        if self.logged_in:
+            return True
+        
         self.setup_driver()
         
         if not self.login():
             self.logger.error("Failed to login - skipping LinkedIn scraping")
             self.cleanup()
-            return
+            return False
+        
+        self.logged_in = True
+        return True
+    
+    def _scrape_batch(self, company_names: List[str]) -> Optional[List[Dict]]:
+        """Scrape companies one after another in a single browser session.
+        Returns None if the LinkedIn login failed.
+        """
+        if not self.start_session():
+            return None
+        
+        api_results = {}
+        if self.config.LINKEDIN_USE_API:
+            self.api_session = self._build_api_session()
+            if self.api_session:
+                api_results = self._search_companies_via_api(company_names)
         
         all_profiles = []
         
         for company in company_names:
             try:
-                self.logger.info(f"Searching UW alumni at {company}")
-                
-                profiles = self.search_uw_alumni_at_company(company)
+                profiles = api_results.get(company)
+                used_browser = profiles is None
+                if used_browser:
+                    self.logger.info(f"Searching UW alumni at {company}")
+                    profiles = self.search_uw_alumni_at_company(company)
                 
                 if profiles:
                     all_profiles.extend(profiles)
@@ -634,20 +891,61 @@ class UWLinkedInScraper:
                         print(f"   • ... and {len(profiles) - 3} more")
                 else:
                     print(f"No UW alumni found at {company}")
+                self.record_company_search(company)
                 
-                # Longer delay between companies to be respectful
-                time.sleep(random.uniform(self.config.REQUEST_DELAY_MIN, self.config.REQUEST_DELAY_MAX))
+                # Longer delay between browser searches to be respectful
+                if used_browser:
+                    time.sleep(random.uniform(self.config.REQUEST_DELAY_MIN, self.config.REQUEST_DELAY_MAX))
                 
             except Exception as e:
                 self.logger.error(f"Error scraping {company}: {e}")
                 continue
         
         self.cleanup()
+        return all_profiles
+    
+    def _scrape_in_parallel(self, company_names: List[str], workers: int) -> Optional[List[Dict]]:
+        """Split companies across worker processes, each with its own Chrome session.
+        Returns None if the LinkedIn login failed.
+        """
+        # Log in once here; each worker starts from its own copy of the saved
+        # session, so they neither log in to the account separately nor write
+        # the same session file
+        if not self.start_session():
+            return None
+        self.save_session()
+        self.cleanup()
         
-        if all_profiles:
-            print(f"\nTotal: Found {len(all_profiles)} UW alumni across all companies!")
-        else:
-            print("No UW alumni found at any of the target companies.")
+        session_dir = tempfile.mkdtemp(prefix='linkedin_sessions_')
+        batches = [company_names[i::workers] for i in range(workers)]
+        self.logger.info(f"Scraping {len(company_names)} companies with {workers} browser sessions")
+        
+        all_profiles = []
+        failed_companies = []
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for i, batch in enumerate(batches):
+                    session_file = os.path.join(session_dir, f"session_{i}.pkl")
+                    shutil.copyfile(self.session_file, session_file)
+                    futures[executor.submit(_scrape_company_batch, batch, session_file)] = batch
+                
+                for future in as_completed(futures):
+                    try:
+                        profiles = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Scraping worker for {futures[future]} failed: {e}")
+                        profiles = None
+                    if profiles is None:
+                        failed_companies.extend(futures[future])
+                    else:
+                        all_profiles.extend(profiles)
+        finally:
+            shutil.rmtree(session_dir, ignore_errors=True)
+        
+        if failed_companies:
+            self.logger.error(f"Not searched (worker login or crash): {', '.join(failed_companies)}")
+        return all_profiles
     
     def cleanup_temp_dir(self):
         """Clean up temporary user data directory"""
@@ -658,12 +956,31 @@ class UWLinkedInScraper:
             except Exception as e:
                 self.logger.warning(f"Failed to clean up temp directory: {e}")
     
+    def close(self):
+        """Close the database connection; it is reopened on next use"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+    
     def cleanup(self):
         """Clean up resources"""
+        if self.api_session:
+            self.api_session.close()
+            self.api_session = None
         if self.driver:
             self.driver.quit()
+            self.driver = None
             self.logger.info("Browser closed")
+        self.logged_in = False
         self.cleanup_temp_dir()
+        self.close()
+
+def _scrape_company_batch(company_names: List[str], session_file: str) -> Optional[List[Dict]]:
+    """Worker process entry point: scrape a subset of companies in a fresh
+    browser, restoring the login from session_file"""
+    scraper = UWLinkedInScraper()
+    scraper.session_file = session_file
+    return scraper._scrape_batch(company_names)
 
 if __name__ == "__main__":
     scraper = UWLinkedInScraper()
@@ -3,105 +3,153 @@
 Populate database with existing internships for testing Excel integration
 """
 
-import sqlite3
+import hashlib
 import re
+import sqlite3
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from config import Config
+from database import connect
+
+# A "| **[Company](...)** | role | location | application |" table row. Both
+# patterns run over the README's raw bytes; only the captured cells are decoded
+_ROW_RE = re.compile(
+    rb'^\| (?P<company_cell>\*\*\[(?:(?P<company>[^\]|\n]*)\])?[^|\n]*)'
+    rb'\|(?P<role>[^|\n]*)'
+    rb'\|(?P<location>[^|\n]*)'
+    rb'\|(?:[^|\n]*?\[Apply\]\((?P<link>[^)|\n]*)\))?',
+    re.MULTILINE
+)
+_RELEVANT_LOCATION_RE = re.compile(rb'seattle|remote|united states|bellevue|redmond', re.IGNORECASE)
+
+# meta key holding the digest of the README last imported. One digest covers
+# the whole file: any change re-imports every row, and INSERT OR IGNORE skips
+# the ones already saved
+_IMPORTED_README_KEY = 'populate_readme_digest'
+
+def _readme_digest(content: bytes) -> int:
+    """64-bit digest of the README, stored as a signed SQLite INTEGER"""
+    return int.from_bytes(hashlib.blake2b(content, digest_size=8).digest(), 'big', signed=True)
+
+def _last_imported_digest(config: Config) -> Optional[int]:
+    """Digest recorded by the previous successful import, if any"""
+    conn = connect(config.DATABASE_PATH)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (_IMPORTED_README_KEY,)).fetchone()
+        return row[0] if row else None
+    except sqlite3.OperationalError:
+        # meta is created by the GitHub monitor's schema setup
+        return None
+    finally:
+        conn.close()
 
-def parse_current_internships():
-    """Parse current internships from the README file"""
+def parse_current_internships() -> Tuple[List[Dict], Optional[int]]:
+    """Parse current internships from the README file.
+    Returns the internships and the README digest to record once they are
+    saved; the digest is None when there is nothing (new) to import.
+    """
     config = Config()
     
     # Read the SimplifyJobs README
     readme_path = "monitored_repos/Summer2026-Internships/README.md"
     
+    # Kept as bytes: the digest and the row regex both work on this one buffer,
+    # rather than on a decoded str plus a re-encoded copy of it for hashing
     try:
-        with open(readme_path, 'r', encoding='utf-8') as f:
+        with open(readme_path, 'rb') as f:
             content = f.read()
     except FileNotFoundError:
         print("README file not found. Please run GitHub monitoring first.")
-        return []
+        return [], None
     
-    internships = []
-    lines = content.split('\n')
+    # Rows only change when the file does, so skip the parse entirely if this
+    # exact README was already imported
+    digest = _readme_digest(content)
+    if digest == _last_imported_digest(config):
+        print("README unchanged since the last import - nothing new to add.")
+        return [], None
     
-    for line in lines:
-        # Look for table rows with internship data
-        if line.startswith('| **[') and '|' in line:
-            try:
-                parts = [part.strip() for part in line.split('|')]
-                
-                if len(parts) >= 5:
-                    company_part = parts[1]
-                    role_part = parts[2]  
-                    location_part = parts[3]
-                    application_part = parts[4]
-                    
-                    # Extract company name
-                    company_match = re.search(r'\*\*\[(.*?)\]', company_part)
-                    company = company_match.group(1) if company_match else company_part.strip()
-                    
-                    # Skip if continuation row
-                    if company_part.strip() == '↳':
-                        continue
-                    
-                    # Extract application link
-                    app_link_match = re.search(r'\[Apply\]\((.*?)\)', application_part)
-                    app_link = app_link_match.group(1) if app_link_match else ""
-                    
-                    # Check if it's relevant (Seattle, Remote, or US-based)
-                    location_lower = location_part.lower()
-                    if any(loc in location_lower for loc in ['seattle', 'remote', 'united states', 'bellevue', 'redmond']):
-                        internships.append({
-                            'company': company,
-                            'role': role_part.strip(),
-                            'location': location_part.strip(),
-                            'application_link': app_link,
-                            'source_repo': 'Summer2026-Internships',
-                            'discovered_date': datetime.now().isoformat(),
-                            'commit_hash': 'initial_load'
-                        })
-                        
-            except Exception as e:
-                print(f"Error parsing line: {e}")
-                continue
+    # Each company row is matched in one pass over the whole file: the cells are
+    # captured by position, the company name from its **[Name]** link (falling
+    # back to the whole cell) and the link from an [Apply](url) in the 4th cell
+    internships = []
+    discovered_date = datetime.now().isoformat()
+    for match in _ROW_RE.finditer(content):
+        location = match['location'].strip()
+        
+        # Check if it's relevant (Seattle, Remote, or US-based)
+        if _RELEVANT_LOCATION_RE.search(location):
+            company = match['company']
+            link = match['link']
+            internships.append({
+                'company': (company if company is not None else match['company_cell'].strip()).decode('utf-8'),
+                'role': match['role'].strip().decode('utf-8'),
+                'location': location.decode('utf-8'),
+                'application_link': link.decode('utf-8') if link else "",
+                'source_repo': 'Summer2026-Internships',
+                'discovered_date': discovered_date,
+                'commit_hash': 'initial_load'
+            })
     
-    return internships
+    return internships, digest
 
-def save_to_database(internships):
-    """Save internships to database"""
+def save_to_database(internships, readme_digest: Optional[int] = None):
+    """Save internships to database, recording readme_digest as imported in
+    the same transaction"""
     config = Config()
-    conn = sqlite3.connect(config.DATABASE_PATH)
+    conn = connect(config.DATABASE_PATH)
+    
+    rows = [
+        (
+            internship['company'],
+            internship['role'],
+            internship['location'],
+            internship['application_link'],
+            internship['source_repo'],
+            internship['discovered_date'],
+            internship['commit_hash']
+        )
+        for internship in internships
+    ]
     
     saved_count = 0
-    for internship in internships:
-        try:
-            conn.execute('''
+    try:
+        # One statement and one transaction for the whole batch
+        with conn:
+            cursor = conn.executemany('''
                 INSERT OR IGNORE INTO internships 
                 (company, role, location, application_link, source_repo, discovered_date, commit_hash)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                internship['company'],
-                internship['role'],
-                internship['location'],
-                internship['application_link'],
-                internship['source_repo'],
-                internship['discovered_date'],
-                internship['commit_hash']
-            ))
-            saved_count += 1
-        except Exception as e:
-            print(f"Error saving internship: {e}")
-    
-    conn.commit()
-    conn.close()
+            ''', rows)
+            inserted = cursor.rowcount
+            if readme_digest is not None:
+                # Databases set up before meta existed don't have it yet; same
+                # definition as the GitHub monitor's schema setup
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS meta (
+                        key TEXT PRIMARY KEY,
+                        value INTEGER
+                    )
+                ''')
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (_IMPORTED_README_KEY, readme_digest)
+                )
+        # Only counted once the transaction has committed
+        saved_count = inserted
+    except Exception as e:
+        print(f"Error saving internships: {e}")
+    finally:
+        conn.close()
     
     print(f"Saved {saved_count} internships to database")
     return saved_count
 
 def main():
     print("Parsing existing internships from repository...")
-    internships = parse_current_internships()
+    internships, readme_digest = parse_current_internships()
+    if readme_digest is None:
+        return
     
     if internships:
         print(f"Found {len(internships)} relevant internship opportunities")
@@ -115,7 +163,7 @@ def main():
             print(f"   ... and {len(internships) - 5} more!")
         
         # Save to database
-        saved_count = save_to_database(internships)
+        saved_count = save_to_database(internships, readme_digest)
         
         if saved_count > 0:
             print(f"\nSuccessfully added {saved_count} internships!")
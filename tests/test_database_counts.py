@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the trigger-maintained row counts set up by InternshipGitHubMonitor
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from github_monitor import InternshipGitHubMonitor
+
+INSERT_INTERNSHIP = '''
+    INSERT OR IGNORE INTO internships (company, role, location, application_link, source_repo, discovered_date)
+    VALUES (?, ?, 'Seattle, WA', ?, 'test', datetime('now'))
+'''
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    """Monitor with a fresh database under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'logs').mkdir()
+    (tmp_path / 'output').mkdir()
+    monitor = InternshipGitHubMonitor()
+    yield monitor
+    monitor.close()
+
+def meta_count(conn, key):
+    return conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()[0]
+
+def test_meta_counts_follow_inserts_and_deletes(monitor):
+    conn = monitor._get_connection()
+    with conn:
+        conn.execute(INSERT_INTERNSHIP, ('Acme', 'SWE Intern', 'https://a/1'))
+        conn.execute(INSERT_INTERNSHIP, ('Acme', 'SWE Intern', 'https://a/1'))  # ignored duplicate
+        conn.execute(INSERT_INTERNSHIP, ('Globex', 'Data Intern', 'https://g/1'))
+        conn.execute("INSERT INTO profiles (name, company, linkedin_url) VALUES ('Ann', 'Acme', 'u1')")
+    
+    assert meta_count(conn, 'internship_count') == 2
+    assert meta_count(conn, 'profile_count') == 1
+    
+    with conn:
+        conn.execute("DELETE FROM internships WHERE company = 'Globex'")
+    assert meta_count(conn, 'internship_count') == 1
+
+def test_meta_counts_seeded_once(monitor):
+    """Re-running setup on a populated database keeps the counts exact"""
+    conn = monitor._get_connection()
+    with conn:
+        conn.execute(INSERT_INTERNSHIP, ('Acme', 'SWE Intern', 'https://a/1'))
+    
+    monitor.setup_database()
+    assert meta_count(conn, 'internship_count') == 1
+    assert meta_count(conn, 'internship_count') == conn.execute("SELECT COUNT(*) FROM internships").fetchone()[0]
+
+def company_counts(conn):
+    return dict(conn.execute("SELECT company, n FROM company_stats").fetchall())
+
+def test_company_stats_follow_inserts_and_deletes(monitor):
+    conn = monitor._get_connection()
+    with conn:
+        conn.execute(INSERT_INTERNSHIP, ('Acme', 'SWE Intern', 'https://a/1'))
+        conn.execute(INSERT_INTERNSHIP, ('Acme', 'Data Intern', 'https://a/2'))
+        conn.execute(INSERT_INTERNSHIP, ('Globex', 'SWE Intern', 'https://g/1'))
+    assert company_counts(conn) == {'Acme': 2, 'Globex': 1}
+    
+    with conn:
+        conn.execute("DELETE FROM internships WHERE company = 'Globex'")
+        conn.execute("DELETE FROM internships WHERE application_link = 'https://a/1'")
+    assert company_counts(conn) == {'Acme': 1}
+
+def test_company_stats_seeded_once(monitor):
+    conn = monitor._get_connection()
+    with conn:
+        conn.execute(INSERT_INTERNSHIP, ('Acme', 'SWE Intern', 'https://a/1'))
+    
+    monitor.setup_database()
+    assert company_counts(conn) == {'Acme': 1}
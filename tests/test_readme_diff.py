@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for InternshipGitHubMonitor.parse_readme_diff against a scratch git repo
+"""
+
+import os
+import sys
+
+import pytest
+from git import Repo
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from github_monitor import InternshipGitHubMonitor
+
+REPO_NAME = 'Summer2026-Internships'
+
+def row(company, role):
+    link = f'https://example.com/{company}'
+    return f'| **[{company}](https://{company}.com)** | {role} | Seattle, WA | <a href="{link}">[Apply]({link})</a> | 0d |'
+
+def readme(swe_rows, ds_rows):
+    return '\n'.join([
+        '# Summer 2026 Internships',
+        '',
+        '## 💻 Software Engineering Internship Roles',
+        '',
+        '| Company | Role | Location | Application | Age |',
+        '| ------- | ---- | -------- | ----------- | --- |',
+        *swe_rows,
+        '',
+        '## 📈 Data Science, AI & Machine Learning Internship Roles',
+        '',
+        '| Company | Role | Location | Application | Age |',
+        '| ------- | ---- | -------- | ----------- | --- |',
+        *ds_rows,
+        '',
+    ])
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'logs').mkdir()
+    (tmp_path / 'output').mkdir()
+    monitor = InternshipGitHubMonitor()
+    yield monitor
+    monitor.close()
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = Repo.init(tmp_path / 'readme_repo')
+    with repo.config_writer() as config:
+        config.set_value('user', 'name', 'test')
+        config.set_value('user', 'email', 'test@example.com')
+    return repo
+
+def commit_readme(repo, text):
+    with open(os.path.join(repo.working_tree_dir, 'README.md'), 'w', encoding='utf-8') as f:
+        f.write(text)
+    repo.index.add(['README.md'])
+    return repo.index.commit('update').hexsha
+
+def test_added_rows_match_full_parse(monitor, repo):
+    old = commit_readme(repo, readme([row('Acme', 'Software Intern')], [row('Initech', 'Data Intern')]))
+    new_text = readme([row('Acme', 'Software Intern'), row('Globex', 'Software Intern')],
+                      [row('Initech', 'Data Intern'), row('Umbrella', 'ML Intern')])
+    new = commit_readme(repo, new_text)
+    
+    added = monitor.parse_readme_diff(repo, old, new, REPO_NAME)
+    
+    assert sorted(i['company'] for i in added) == ['Globex', 'Umbrella']
+    full = {i['company']: i['section'] for i in monitor.parse_readme_for_internships(new_text, REPO_NAME, new)}
+    for internship in added:
+        assert internship['section'] == full[internship['company']]
+    assert full['Globex'] != full['Umbrella']
+
+def test_already_parsed_readme_is_skipped(monitor, repo):
+    old = commit_readme(repo, readme([row('Acme', 'Software Intern')], []))
+    new = commit_readme(repo, readme([row('Acme', 'Software Intern'), row('Globex', 'Software Intern')], []))
+    
+    assert len(monitor.parse_readme_diff(repo, old, new, REPO_NAME)) == 1
+    assert monitor.parse_readme_diff(repo, old, new, REPO_NAME) == []
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for matching rsync error output to the files sync_from_ec2 downloads
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+from sync_from_ec2 import _parse_rsync_errors
+
+REMOTE_PATH = "/home/ubuntu/Internship-Filter"
+FILENAMES = ["internship_tracker.db", "UW_Internship_Tracker.xlsx", "found_opportunities.csv", ".env"]
+
+def test_missing_and_unreadable_files_are_errors():
+    """Both 'not found' and permission errors mark their file failed"""
+    stderr = (
+        f'rsync: [sender] link_stat "{REMOTE_PATH}/.env" failed: No such file or directory (2)\n'
+        f'rsync: [sender] send_files failed to open "{REMOTE_PATH}/found_opportunities.csv": Permission denied (13)\n'
+        'rsync error: some files/attrs were not transferred (see previous errors) (code 23) at main.c(1865)\n'
+    )
+    errors = _parse_rsync_errors(stderr, REMOTE_PATH, FILENAMES)
+    
+    assert set(errors) == {".env", "found_opportunities.csv"}
+    assert "Permission denied" in errors["found_opportunities.csv"]
+    assert "No such file" in errors[".env"]
+
+def test_summary_line_alone_fails_nothing():
+    """The closing 'rsync error:' summary names no file"""
+    stderr = "rsync error: some files/attrs were not transferred (see previous errors) (code 23)\n"
+    assert _parse_rsync_errors(stderr, REMOTE_PATH, FILENAMES) == {}
+
+def test_clean_transfer():
+    assert _parse_rsync_errors("", REMOTE_PATH, FILENAMES) == {}
+
+def test_other_remote_paths_are_ignored():
+    """A file of the same name elsewhere on the instance is not ours"""
+    stderr = 'rsync: [sender] link_stat "/tmp/internship_tracker.db" failed: No such file or directory (2)\n'
+    assert _parse_rsync_errors(stderr, REMOTE_PATH, FILENAMES) == {}